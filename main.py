@@ -303,16 +303,18 @@ class ArbiPhoenix:
         
         # Keep running until interrupted
         try:
+            loop = asyncio.get_running_loop()
+            last_status_time = None
             while self.is_running:
                 await asyncio.sleep(10)  # Check every 10 seconds
                 
                 # Show basic status every minute
-                if hasattr(self, '_last_status_time'):
-                    if asyncio.get_event_loop().time() - self._last_status_time > 60:
-                        await self._show_console_status()
-                        self._last_status_time = asyncio.get_event_loop().time()
-                else:
-                    self._last_status_time = asyncio.get_event_loop().time()
+                now = loop.time()
+                if last_status_time is None:
+                    last_status_time = now
+                elif now - last_status_time > 60:
+                    await self._show_console_status()
+                    last_status_time = now
                     
         except KeyboardInterrupt:
             print("\n🔥 Console mode interrupted by user")
@@ -375,8 +377,8 @@ class PhoenixApp:
             
             if GUI_AVAILABLE and self.phoenix.dashboard:
                 if GUI_TYPE == "PyQt":
-                    # PyQt GUI Mode
-                    self.app = QApplication(sys.argv)
+                    # PyQt GUI Mode (main_sync already created the app and its qasync loop)
+                    self.app = QApplication.instance() or QApplication(sys.argv)
                     self.app.setApplicationName("Arbi Phoenix")
                     self.app.setApplicationVersion("1.0")
                     
@@ -395,7 +397,7 @@ class PhoenixApp:
                     signal.signal(signal.SIGINT, self._signal_handler)
                     signal.signal(signal.SIGTERM, self._signal_handler)
                     
-                    # Run Qt event loop with asyncio
+                    # Qt events are served by the qasync loop; wait for quit
                     await self._run_qt_loop()
                     
                 elif GUI_TYPE == "tkinter":
@@ -436,16 +438,9 @@ class PhoenixApp:
                 await self.phoenix.stop()
     
     async def _run_qt_loop(self):
-        """Run Qt event loop asynchronously"""
-        # Create a timer to process Qt events
-        timer = QTimer()
-        timer.timeout.connect(lambda: None)  # Keep event loop alive
-        timer.start(10)  # 10ms interval
-        
-        # Process events until application quits
+        """Wait for the Qt application to quit while qasync dispatches its events"""
         while not self.app.property("quit_requested"):
-            self.app.processEvents()
-            await asyncio.sleep(0.01)  # Small delay to prevent CPU spinning
+            await asyncio.sleep(0.1)
     
     async def _run_tkinter_loop(self):
         """Run tkinter GUI loop asynchronously"""
@@ -469,7 +464,7 @@ class PhoenixApp:
     def _signal_handler(self, signum, frame):
         """Handle system signals"""
         print(f"\n🔥 Received signal {signum} - Shutting down Phoenix...")
-        if hasattr(self, 'app') and self.app:
+        if self.app:
             self.app.setProperty("quit_requested", True)
         if self.phoenix:
             asyncio.create_task(self.phoenix.stop())
@@ -55,6 +55,7 @@ class OrderRequest:
     comment: str = "Phoenix Order"
     expiration: Optional[datetime] = None
     deviation: int = 10  # Price deviation in points
+    placement_time: Optional[int] = None  # Epoch ns to hold the send until (aligns batch legs)
 
 @dataclass
 class OrderResult:
@@ -168,6 +169,12 @@ class BrokerOrderExecutor:
     
     async def execute_order(self, order_request: OrderRequest) -> OrderResult:
         """Execute order with broker-specific handling"""
+        # Hold timed orders so legs stamped with the same time go out together
+        if order_request.placement_time is not None:
+            delay = (order_request.placement_time - time.time_ns()) / 1e9
+            if delay > 0:
+                await asyncio.sleep(delay)
+        
         start_time = time.time()
         
         try:
@@ -394,6 +401,37 @@ class BrokerOrderExecutor:
         self.logger.info("📝 FXCM order execution - Implementation pending")
         return OrderResult(success=False, error_message="FXCM not implemented")
     
+    async def execute_batch(self, order_requests: List[OrderRequest],
+                            placement_delay: Optional[float] = None) -> List[OrderResult]:
+        """Execute several orders together (e.g. triangle legs), results in request order
+        
+        With placement_delay (seconds), legs without a placement_time are all
+        stamped with the same send time, so staggered dispatch does not skew them.
+        """
+        if placement_delay is not None:
+            placement_time = time.time_ns() + int(placement_delay * 1e9)
+            for order in order_requests:
+                if order.placement_time is None:
+                    order.placement_time = placement_time
+        
+        results = await asyncio.gather(
+            *(self.execute_order(order) for order in order_requests),
+            return_exceptions=True
+        )
+        
+        order_results = []
+        for result in results:
+            if isinstance(result, Exception):
+                order_results.append(OrderResult(
+                    success=False,
+                    status=OrderStatus.REJECTED,
+                    error_message=str(result)
+                ))
+            else:
+                order_results.append(result)
+        
+        return order_results
+    
     async def execute_triangle_arbitrage(self, 
                                        pair1: str, pair2: str, pair3: str,
                                        volumes: List[float],
@@ -416,20 +454,7 @@ class BrokerOrderExecutor:
             ))
         
         # Execute all orders simultaneously
-        tasks = [self.execute_order(order) for order in orders]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Process results
-        order_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                order_results.append(OrderResult(
-                    success=False,
-                    status=OrderStatus.REJECTED,
-                    error_message=str(result)
-                ))
-            else:
-                order_results.append(result)
+        order_results = await self.execute_batch(orders)
         
         # Log summary
         successful_orders = sum(1 for r in order_results if r.success)
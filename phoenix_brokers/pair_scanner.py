@@ -176,23 +176,14 @@ class BrokerPairScanner:
         try:
             import MetaTrader5 as mt5
             
-            # Initialize MT5
-            if not mt5.initialize():
-                raise Exception("MT5 initialization failed")
-            
-            # Login to account
-            login = self.broker_config.get('login')
-            password = self.broker_config.get('password')
-            server = self.broker_config.get('server')
-            
-            if login and password and server:
-                if not mt5.login(int(login), password, server):
-                    raise Exception(f"MT5 login failed: {mt5.last_error()}")
+            # The MT5 terminal handshake is blocking; keep it off the event loop
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._connect_mt5, mt5)
             
             self.mt5 = mt5
             self.is_connected = True
             self.connection_status = "Connected"
-            self.last_connection_check = asyncio.get_event_loop().time()
+            self.last_connection_check = loop.time()
             self.logger.info("✅ MT5 connection established")
             
         except ImportError:
@@ -200,6 +191,21 @@ class BrokerPairScanner:
         except Exception as e:
             raise Exception(f"MT5 connection failed: {e}")
     
+    def _connect_mt5(self, mt5):
+        """Initialize and log in to the MT5 terminal (blocking)"""
+        # Initialize MT5
+        if not mt5.initialize():
+            raise Exception("MT5 initialization failed")
+        
+        # Login to account
+        login = self.broker_config.get('login')
+        password = self.broker_config.get('password')
+        server = self.broker_config.get('server')
+        
+        if login and password and server:
+            if not mt5.login(int(login), password, server):
+                raise Exception(f"MT5 login failed: {mt5.last_error()}")
+    
     async def _initialize_ib(self):
         """Initialize Interactive Brokers connection"""
         # Placeholder for IB implementation
@@ -498,7 +504,7 @@ class BrokerPairScanner:
                 else:
                     self.is_connected = True
                     self.connection_status = "Connected"
-                    self.last_connection_check = asyncio.get_event_loop().time()
+                    self.last_connection_check = asyncio.get_running_loop().time()
             
         except Exception as e:
             self.logger.error(f"❌ Connection health check failed: {e}")
@@ -529,7 +535,7 @@ class BrokerPairScanner:
         """Disconnect from broker"""
         try:
             if self.broker_type == BrokerType.MT5 and hasattr(self, 'mt5'):
-                self.mt5.shutdown()
+                await asyncio.get_running_loop().run_in_executor(None, self.mt5.shutdown)
             
             self.is_connected = False
             self.connection_status = "Disconnected"
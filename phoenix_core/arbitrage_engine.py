@@ -7,7 +7,7 @@ Advanced triangular arbitrage detection and execution system
 
 import asyncio
 import logging
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 import numpy as np
@@ -69,6 +69,12 @@ class Position:
     open_time: datetime
     magic_number: int
 
+def _opportunity_key(opp: TriangleOpportunity) -> tuple:
+    """Triangle plus the displayed fields of an opportunity"""
+    return (opp.pair1, opp.pair2, opp.pair3, opp.direction,
+            opp.profit_pips, opp.spread_cost, opp.net_profit,
+            opp.confidence, opp.is_executable)
+
 class ArbitrageEngine:
     """
     🔥 Advanced Triangular Arbitrage Engine
@@ -99,6 +105,13 @@ class ArbitrageEngine:
         self.executed_triangles = 0
         self.total_profit = 0.0
         
+        # Change revisions, bumped whenever the opportunity/position lists change
+        self.opportunities_revision = 0
+        self.positions_revision = 0
+        
+        # Callbacks notified with 'opportunities' / 'positions' on each revision bump
+        self.change_listeners: List[Callable[[str], None]] = []
+        
         # Performance metrics
         self.opportunities_found = 0
         self.opportunities_executed = 0
@@ -218,9 +231,16 @@ class ArbitrageEngine:
                 if opportunity and opportunity.is_executable:
                     new_opportunities.append(opportunity)
             
-            # Update opportunities list
+            # Update opportunities list; the detection timestamp is ignored so an
+            # unchanged scan does not count as a change
+            changed = ([_opportunity_key(o) for o in new_opportunities] !=
+                       [_opportunity_key(o) for o in self.opportunities])
+            if changed:
+                self.opportunities_revision += 1
             self.opportunities = new_opportunities
             self.opportunities_found += len(new_opportunities)
+            if changed:
+                self._notify_change('opportunities')
             
             if new_opportunities:
                 self.logger.info(f"🎯 Found {len(new_opportunities)} arbitrage opportunities")
@@ -628,7 +648,7 @@ class ArbitrageEngine:
                 # Get positions with our magic number
                 positions = mt5.positions_get()
                 if positions is not None:
-                    self.active_positions = [
+                    active_positions = [
                         Position(
                             ticket=pos.ticket,
                             symbol=pos.symbol,
@@ -645,6 +665,13 @@ class ArbitrageEngine:
                         for pos in positions
                         if pos.magic == self.magic_number
                     ]
+                    
+                    changed = active_positions != self.active_positions
+                    if changed:
+                        self.positions_revision += 1
+                    self.active_positions = active_positions
+                    if changed:
+                        self._notify_change('positions')
             
         except Exception as e:
             self.logger.error(f"❌ Position update failed: {e}")
@@ -681,7 +708,9 @@ class ArbitrageEngine:
                     "comment": "Phoenix close",
                 }
                 
-                result = mt5.order_send(request)
+                # order_send blocks on the terminal round-trip
+                loop = asyncio.get_running_loop()
+                result = await loop.run_in_executor(None, mt5.order_send, request)
                 if result.retcode == mt5.TRADE_RETCODE_DONE:
                     self.logger.info(f"✅ Position closed: {position.ticket}")
                     self.total_profit += position.profit
@@ -708,6 +737,18 @@ class ArbitrageEngine:
         if self.opportunities_found > 0:
             self.success_rate = (self.opportunities_executed / self.opportunities_found) * 100
     
+    def add_change_listener(self, callback: Callable[[str], None]):
+        """Register a callback for opportunity/position list changes"""
+        self.change_listeners.append(callback)
+    
+    def _notify_change(self, kind: str):
+        """Notify listeners that a list changed"""
+        for callback in self.change_listeners:
+            try:
+                callback(kind)
+            except Exception as e:
+                self.logger.error(f"❌ Change listener failed: {e}")
+    
     def get_status(self) -> Dict:
         """Get current engine status"""
         return {
@@ -6,31 +6,32 @@ Modern PyQt6-based trading dashboard with Start Trade functionality
 """
 
 import sys
+import time
 import asyncio
 import logging
-from typing import Dict, List, Optional
-from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from collections import deque
 import json
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QGridLayout, QLabel, QPushButton, QTextEdit, QTableWidget,
-    QTableWidgetItem, QProgressBar, QGroupBox, QFrame, QSplitter,
+    QGridLayout, QLabel, QPushButton, QTextEdit, QTableView, QListView,
+    QHeaderView, QAbstractItemView, QProgressBar, QGroupBox, QFrame, QSplitter,
     QTabWidget, QScrollArea, QMessageBox, QDialog, QFormLayout,
     QLineEdit, QSpinBox, QDoubleSpinBox, QCheckBox, QComboBox
 )
 from PyQt6.QtCore import (
-    Qt, QTimer, QThread, pyqtSignal, QPropertyAnimation,
-    QEasingCurve, QRect, QSize
+    Qt, QObject, QTimer, QThread, QMutex, pyqtSignal, QPropertyAnimation,
+    QEasingCurve, QRect, QSize, QAbstractTableModel, QAbstractListModel,
+    QModelIndex
 )
 from PyQt6.QtGui import (
     QFont, QPalette, QColor, QPixmap, QIcon, QPainter,
     QLinearGradient, QBrush
 )
 
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
+from qasync import QEventLoop, asyncSlot, asyncClose
+
 import numpy as np
 
 class PhoenixStyle:
@@ -56,7 +57,10 @@ class PhoenixStyle:
     @staticmethod
     def get_stylesheet():
         """Get main application stylesheet"""
-        return f"""
+        return _STYLESHEET
+
+# Main application stylesheet, built once at import
+_STYLESHEET = f"""
         QMainWindow {{
             background-color: {PhoenixStyle.BACKGROUND};
             color: {PhoenixStyle.TEXT_PRIMARY};
@@ -149,7 +153,7 @@ class PhoenixStyle:
             font-weight: bold;
         }}
         
-        QTextEdit {{
+        QTextEdit, QListView {{
             background-color: {PhoenixStyle.SURFACE};
             border: 1px solid {PhoenixStyle.PRIMARY};
             border-radius: 4px;
@@ -158,7 +162,7 @@ class PhoenixStyle:
             font-size: {PhoenixStyle.FONT_SIZE_SMALL}px;
         }}
         
-        QTableWidget {{
+        QTableView {{
             background-color: {PhoenixStyle.SURFACE};
             alternate-background-color: #3A3A3A;
             border: 1px solid {PhoenixStyle.PRIMARY};
@@ -166,12 +170,12 @@ class PhoenixStyle:
             gridline-color: #555555;
         }}
         
-        QTableWidget::item {{
+        QTableView::item {{
             padding: 8px;
             border-bottom: 1px solid #555555;
         }}
         
-        QTableWidget::item:selected {{
+        QTableView::item:selected {{
             background-color: {PhoenixStyle.PRIMARY};
         }}
         
@@ -218,11 +222,67 @@ class PhoenixStyle:
             background-color: #FF8A65;
             color: white;
         }}
+        
+        QLabel[metricState="neutral"] {{
+            color: {PhoenixStyle.PRIMARY};
+        }}
+        
+        QLabel[metricState="positive"] {{
+            color: {PhoenixStyle.SUCCESS};
+        }}
+        
+        QLabel[metricState="negative"] {{
+            color: {PhoenixStyle.ERROR};
+        }}
         """
 
+# Shared color objects, built once instead of per cell / per paint
+_COL_PRIMARY = QColor(PhoenixStyle.TEXT_PRIMARY)
+_COL_SUCCESS = QColor(PhoenixStyle.SUCCESS)
+_COL_ERROR = QColor(PhoenixStyle.ERROR)
+_COL_WARNING = QColor(PhoenixStyle.WARNING)
+_COL_SECONDARY = QColor(PhoenixStyle.TEXT_SECONDARY)
+_COL_INACTIVE = QColor("#666666")
+
+_STATUS_BRUSHES = {
+    "connected": QBrush(_COL_SUCCESS),
+    "disconnected": QBrush(_COL_INACTIVE),
+    "error": QBrush(_COL_ERROR),
+    "warning": QBrush(_COL_WARNING)
+}
+
+# Static metric card styles; value colors come from the metricState selectors
+# (a QPalette would be overridden by the application stylesheet's QLabel color)
+_METRIC_VALUE_STYLE = "font-size: 24px; font-weight: bold; margin: 10px;"
+_METRIC_UNIT_STYLE = f"font-size: 12px; color: {PhoenixStyle.TEXT_SECONDARY};"
+_CONNECTED_STYLE = f"color: {PhoenixStyle.SUCCESS}"
+_DISCONNECTED_STYLE = f"color: {PhoenixStyle.ERROR}"
+
+# Seconds between broker connection checks, run from the dashboard timer
+_CONNECTION_CHECK_SECONDS = 5.0
+
+# Smoothing factor for the measured dashboard refresh cost
+_TICK_EWMA_ALPHA = 0.2
+
+# Last formatted log timestamp, reused for every message within that second
+_last_ts_sec = -1
+_last_ts_str = ""
+
+def _log_timestamp() -> str:
+    """Current time as HH:MM:SS, formatted at most once per second"""
+    global _last_ts_sec, _last_ts_str
+    sec = int(time.time())
+    if sec != _last_ts_sec:
+        _last_ts_sec = sec
+        _last_ts_str = time.strftime("%H:%M:%S", time.localtime(sec))
+    return _last_ts_str
+
 class StatusIndicator(QLabel):
     """Animated status indicator"""
     
+    # Pre-rendered dot per status, shared by all indicators
+    _status_pixmaps: Optional[Dict[str, QPixmap]] = None
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFixedSize(20, 20)
@@ -230,27 +290,39 @@ class StatusIndicator(QLabel):
         self.animation = QPropertyAnimation(self, b"geometry")
         self.animation.setDuration(1000)
         self.animation.setEasingCurve(QEasingCurve.Type.InOutQuad)
+        self._brushes = _STATUS_BRUSHES
         
+        if StatusIndicator._status_pixmaps is None:
+            StatusIndicator._status_pixmaps = self._render_pixmaps()
+        self._pixmaps = StatusIndicator._status_pixmaps
+    
+    def _render_pixmaps(self) -> Dict[str, QPixmap]:
+        """Render the status dot once for every status"""
+        pixmaps = {}
+        for status, brush in self._brushes.items():
+            pixmap = QPixmap(20, 20)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setBrush(brush)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.drawEllipse(2, 2, 16, 16)
+            painter.end()
+            
+            pixmaps[status] = pixmap
+        return pixmaps
+    
     def set_status(self, status: str):
         """Set status: connected, disconnected, error, warning"""
+        if status == self.status:
+            return
         self.status = status
         self.update()
         
     def paintEvent(self, event):
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        colors = {
-            "connected": PhoenixStyle.SUCCESS,
-            "disconnected": "#666666",
-            "error": PhoenixStyle.ERROR,
-            "warning": PhoenixStyle.WARNING
-        }
-        
-        color = colors.get(self.status, "#666666")
-        painter.setBrush(QBrush(QColor(color)))
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawEllipse(2, 2, 16, 16)
+        painter.drawPixmap(0, 0, self._pixmaps.get(self.status, self._pixmaps["disconnected"]))
 
 class MetricCard(QGroupBox):
     """Metric display card"""
@@ -264,35 +336,35 @@ class MetricCard(QGroupBox):
         # Value label
         self.value_label = QLabel(value)
         self.value_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.value_label.setStyleSheet(f"""
-            font-size: 24px;
-            font-weight: bold;
-            color: {PhoenixStyle.PRIMARY};
-            margin: 10px;
-        """)
+        self.value_label.setStyleSheet(_METRIC_VALUE_STYLE)
+        self.value_label.setProperty("metricState", "neutral")
         
         # Unit label
         self.unit_label = QLabel(unit)
         self.unit_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.unit_label.setStyleSheet(f"""
-            font-size: 12px;
-            color: {PhoenixStyle.TEXT_SECONDARY};
-        """)
+        self.unit_label.setStyleSheet(_METRIC_UNIT_STYLE)
         
         layout.addWidget(self.value_label)
         layout.addWidget(self.unit_label)
         self.setLayout(layout)
+        
+        self._value = value
+        self._state = "neutral"
     
-    def update_value(self, value: str, color: str = None):
-        """Update the displayed value"""
-        self.value_label.setText(value)
-        if color:
-            self.value_label.setStyleSheet(f"""
-                font-size: 24px;
-                font-weight: bold;
-                color: {color};
-                margin: 10px;
-            """)
+    def update_value(self, value: str, state: str = None):
+        """Update the displayed value; state is neutral, positive or negative"""
+        if value != self._value:
+            self._value = value
+            self.value_label.setText(value)
+        
+        # Recolor through the metricState selectors instead of a new stylesheet;
+        # only this label is re-polished, and only when the state flips
+        if state and state != self._state:
+            self._state = state
+            self.value_label.setProperty("metricState", state)
+            style = self.value_label.style()
+            style.unpolish(self.value_label)
+            style.polish(self.value_label)
 
 class TradingControlPanel(QGroupBox):
     """Main trading control panel with Start Trade button"""
@@ -300,6 +372,7 @@ class TradingControlPanel(QGroupBox):
     start_trading = pyqtSignal()
     stop_trading = pyqtSignal()
     pause_trading = pyqtSignal()
+    resume_trading = pyqtSignal()
     
     def __init__(self, parent=None):
         super().__init__("🔥 Trading Control", parent)
@@ -361,6 +434,11 @@ class TradingControlPanel(QGroupBox):
         layout.addLayout(mode_layout)
         self.setLayout(layout)
     
+    def set_status_text(self, text: str):
+        """Update the status label, skipping repeats"""
+        if text != self.status_label.text():
+            self.status_label.setText(text)
+    
     def on_start_clicked(self):
         """Handle start button click"""
         if not self.is_trading:
@@ -373,13 +451,13 @@ class TradingControlPanel(QGroupBox):
             self.pause_trading.emit()
             self.is_paused = True
             self.pause_button.setText("▶️ RESUME")
-            self.status_label.setText("Trading Paused")
+            self.set_status_text("Trading Paused")
             self.status_indicator.set_status("warning")
         else:
-            self.start_trading.emit()
+            self.resume_trading.emit()
             self.is_paused = False
             self.pause_button.setText("⏸️ PAUSE")
-            self.status_label.setText("Trading Active")
+            self.set_status_text("Trading Active")
             self.status_indicator.set_status("connected")
     
     def on_stop_clicked(self):
@@ -398,13 +476,13 @@ class TradingControlPanel(QGroupBox):
             self.pause_button.setEnabled(True)
             self.stop_button.setEnabled(True)
             self.pause_button.setText("⏸️ PAUSE")
-            self.status_label.setText("Trading Active")
+            self.set_status_text("Trading Active")
             self.status_indicator.set_status("connected")
         else:
             self.start_button.setEnabled(True)
             self.pause_button.setEnabled(False)
             self.stop_button.setEnabled(False)
-            self.status_label.setText("Trading Stopped")
+            self.set_status_text("Trading Stopped")
             self.status_indicator.set_status("disconnected")
     
     def set_connection_status(self, connected: bool):
@@ -412,16 +490,292 @@ class TradingControlPanel(QGroupBox):
         if connected:
             self.start_button.setEnabled(True)
             if not self.is_trading:
-                self.status_label.setText("System Ready")
+                self.set_status_text("System Ready")
                 self.status_indicator.set_status("connected")
         else:
             self.start_button.setEnabled(False)
             self.pause_button.setEnabled(False)
             self.stop_button.setEnabled(False)
-            self.status_label.setText("Broker Disconnected")
+            self.set_status_text("Broker Disconnected")
             self.status_indicator.set_status("error")
 
-class OpportunityTable(QTableWidget):
+class RecordTableModel(QAbstractTableModel):
+    """Read-only table model over a list of engine records
+    
+    Display strings and foreground colors are formatted once when rows are
+    ingested, so data() is a plain lookup on every paint. Updates are diffed
+    by row_key() so only inserted, removed or changed rows are signalled.
+    
+    Subclasses set HEADERS and provide:
+        row_key(record) -> hashable stable identity of a record
+        format_row(record) -> (texts, colors) tuples, one entry per column
+    A subclass that formats rows in bulk may override format_rows() instead
+    of format_row().
+    """
+    
+    HEADERS: List[str] = []
+    SERVED_ROLES = frozenset((
+        Qt.ItemDataRole.DisplayRole,
+        Qt.ItemDataRole.ForegroundRole,
+        Qt.ItemDataRole.TextAlignmentRole
+    ))
+    ALIGNMENT = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List = []
+        self._keys: List = []
+        self._texts: List[tuple] = []
+        self._colors: List[tuple] = []
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+        
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+        
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        # Views query every role per cell; answer only the ones we render
+        if role not in self.SERVED_ROLES:
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._texts[index.row()][index.column()]
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return self._colors[index.row()][index.column()]
+        return self.ALIGNMENT
+        
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+        
+    def format_rows(self, rows: List) -> Tuple[List[tuple], List[tuple]]:
+        """Format all records; subclasses may batch work across rows"""
+        texts = []
+        colors = []
+        for record in rows:
+            row_texts, row_colors = self.format_row(record)
+            texts.append(row_texts)
+            colors.append(row_colors)
+        return texts, colors
+    
+    def set_rows(self, rows: List):
+        """Replace model contents, signalling only what actually changed"""
+        texts, colors = self.format_rows(rows)
+        keys = [self.row_key(record) for record in rows]
+        
+        # Filling an empty model (or a reorder) is cheapest as a single reset
+        if keys != self._keys and (
+            not self._keys or not self._apply_structure(keys, rows, texts, colors)
+        ):
+            self.beginResetModel()
+            self._rows, self._keys = list(rows), keys
+            self._texts, self._colors = texts, colors
+            self.endResetModel()
+            return
+        
+        self._rows = list(rows)
+        self._emit_changed_cells(texts, colors)
+    
+    def _apply_structure(self, keys: List, rows: List, texts: List[tuple], colors: List[tuple]) -> bool:
+        """Remove vanished rows and insert new ones in place
+        
+        Returns False when rows were reordered (or keys are not unique), in
+        which case the caller falls back to a full reset.
+        """
+        old_keys = set(self._keys)
+        new_keys = set(keys)
+        if len(new_keys) != len(keys) or len(old_keys) != len(self._keys):
+            return False
+        if ([k for k in self._keys if k in new_keys] !=
+                [k for k in keys if k in old_keys]):
+            return False
+        
+        # Remove from the bottom so earlier row numbers stay valid
+        for row in range(len(self._keys) - 1, -1, -1):
+            if self._keys[row] not in new_keys:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._keys[row], self._rows[row], self._texts[row], self._colors[row]
+                self.endRemoveRows()
+        
+        # Surviving rows now match the new order, so insert the rest in place
+        for row, key in enumerate(keys):
+            if key not in old_keys:
+                self.beginInsertRows(QModelIndex(), row, row)
+                self._keys.insert(row, key)
+                self._rows.insert(row, rows[row])
+                self._texts.insert(row, texts[row])
+                self._colors.insert(row, colors[row])
+                self.endInsertRows()
+        return True
+    
+    def _emit_changed_cells(self, texts: List[tuple], colors: List[tuple]):
+        """Store new cell contents and emit a single dataChanged for the changed span"""
+        first_row = last_row = first_col = last_col = None
+        for row, (row_texts, row_colors) in enumerate(zip(texts, colors)):
+            old_texts = self._texts[row]
+            old_colors = self._colors[row]
+            if row_texts == old_texts and row_colors == old_colors:
+                continue
+            
+            changed = [
+                col for col in range(len(row_texts))
+                if row_texts[col] != old_texts[col] or row_colors[col] is not old_colors[col]
+            ]
+            self._texts[row] = row_texts
+            self._colors[row] = row_colors
+            
+            if first_row is None:
+                first_row, first_col, last_col = row, changed[0], changed[-1]
+            else:
+                first_col = min(first_col, changed[0])
+                last_col = max(last_col, changed[-1])
+            last_row = row
+        
+        # One bounding-range signal lets the view repaint the batch in a single pass
+        if first_row is not None:
+            self.dataChanged.emit(self.index(first_row, first_col), self.index(last_row, last_col))
+
+class OpportunityModel(RecordTableModel):
+    """Table model for arbitrage opportunities"""
+    
+    HEADERS = ["Triangle", "Direction", "Profit (Pips)", "Spread Cost", "Net Profit", "Confidence", "Status"]
+    
+    # Foreground colors keyed by (column, is_positive)
+    COLORS = {
+        (1, True): _COL_SUCCESS,
+        (1, False): _COL_WARNING,
+        (2, True): _COL_SUCCESS,
+        (2, False): _COL_ERROR,
+        (4, True): _COL_SUCCESS,
+        (4, False): _COL_ERROR,
+        (6, True): _COL_SUCCESS,
+        (6, False): _COL_SECONDARY,
+    }
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._triangle_labels: Dict[Tuple[str, str, str], str] = {}
+    
+    def row_key(self, opp):
+        return f"{opp.pair1}-{opp.pair2}-{opp.pair3}-{opp.direction}"
+    
+    def triangle_label(self, opp) -> str:
+        """Short triangle label, built once per triangle"""
+        triangle = (opp.pair1, opp.pair2, opp.pair3)
+        label = self._triangle_labels.get(triangle)
+        if label is None:
+            label = f"{opp.pair1[:3]}-{opp.pair2[:3]}-{opp.pair3[:3]}"
+            self._triangle_labels[triangle] = label
+        return label
+    
+    def format_row(self, opp) -> tuple:
+        colors = self.COLORS
+        texts = (
+            self.triangle_label(opp),
+            opp.direction.upper(),
+            f"{opp.profit_pips:.1f}",
+            f"{opp.spread_cost:.1f}",
+            f"{opp.net_profit:.1f}",
+            f"{opp.confidence:.0%}",
+            "READY" if opp.is_executable else "WAIT"
+        )
+        row_colors = (
+            None,
+            colors[(1, opp.direction == "forward")],
+            colors[(2, opp.profit_pips > 0)],
+            None,
+            colors[(4, opp.net_profit > 0)],
+            None,
+            colors[(6, bool(opp.is_executable))]
+        )
+        return texts, row_colors
+        
+    def update_opportunities(self, opportunities: List):
+        """Update model with new opportunities"""
+        self.set_rows(opportunities)
+
+class PositionModel(RecordTableModel):
+    """Table model for active positions"""
+    
+    HEADERS = ["Ticket", "Symbol", "Type", "Volume", "Open Price", "Current Price", "Profit", "Pips", "Time"]
+    
+    # Foreground colors keyed by (column, is_positive)
+    COLORS = {
+        (2, True): _COL_SUCCESS,
+        (2, False): _COL_ERROR,
+        (6, True): _COL_SUCCESS,
+        (6, False): _COL_ERROR,
+        (7, True): _COL_SUCCESS,
+        (7, False): _COL_ERROR,
+    }
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pips = np.zeros(0, dtype=np.float64)
+        self._display: Dict[int, tuple] = {}  # ticket -> (position, texts, colors)
+    
+    def format_rows(self, positions: List) -> Tuple[List[tuple], List[tuple]]:
+        """Format positions, computing pips for all rows in one array operation"""
+        count = len(positions)
+        open_prices = np.fromiter((p.open_price for p in positions), dtype=np.float64, count=count)
+        current_prices = np.fromiter((p.current_price for p in positions), dtype=np.float64, count=count)
+        signs = np.fromiter((-1.0 if p.type == "sell" else 1.0 for p in positions), dtype=np.float64, count=count)
+        
+        # Pips (simplified calculation)
+        self._pips = (current_prices - open_prices) * 10000.0 * signs
+        
+        # Reuse display rows of positions that have not changed since last refresh
+        previous = self._display
+        display = {}
+        texts = []
+        colors = []
+        for pos, pips in zip(positions, self._pips.tolist()):
+            cached = previous.get(pos.ticket)
+            if cached is not None and cached[0] == pos:
+                _, row_texts, row_colors = cached
+            else:
+                row_texts, row_colors = self.format_row(pos, pips)
+            display[pos.ticket] = (pos, row_texts, row_colors)
+            texts.append(row_texts)
+            colors.append(row_colors)
+        self._display = display
+        return texts, colors
+    
+    def row_key(self, pos):
+        return pos.ticket
+    
+    def format_row(self, pos, pips: float) -> tuple:
+        colors = self.COLORS
+        texts = (
+            str(pos.ticket),
+            pos.symbol,
+            pos.type.upper(),
+            f"{pos.volume:.2f}",
+            f"{pos.open_price:.5f}",
+            f"{pos.current_price:.5f}",
+            f"${pos.profit:.2f}",
+            f"{pips:.1f}",
+            pos.open_time.strftime("%H:%M:%S")
+        )
+        row_colors = (
+            None,
+            None,
+            colors[(2, pos.type == "buy")],
+            None,
+            None,
+            None,
+            colors[(6, pos.profit > 0)],
+            colors[(7, pips > 0)],
+            None
+        )
+        return texts, row_colors
+        
+    def update_positions(self, positions: List):
+        """Update model with current positions"""
+        self.set_rows(positions)
+
+class OpportunityTable(QTableView):
     """Table for displaying arbitrage opportunities"""
     
     def __init__(self, parent=None):
@@ -430,9 +784,8 @@ class OpportunityTable(QTableWidget):
         
     def setup_table(self):
         """Setup table structure"""
-        headers = ["Triangle", "Direction", "Profit (Pips)", "Spread Cost", "Net Profit", "Confidence", "Status"]
-        self.setColumnCount(len(headers))
-        self.setHorizontalHeaderLabels(headers)
+        self.opportunity_model = OpportunityModel(self)
+        self.setModel(self.opportunity_model)
         
         # Set column widths
         self.setColumnWidth(0, 120)
@@ -444,57 +797,19 @@ class OpportunityTable(QTableWidget):
         self.setColumnWidth(6, 80)
         
         self.setAlternatingRowColors(True)
-        self.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        
+        # Fixed geometry so painting only touches visible rows
+        self.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.verticalHeader().setDefaultSectionSize(24)
+        self.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
         
     def update_opportunities(self, opportunities: List):
         """Update table with new opportunities"""
-        self.setRowCount(len(opportunities))
-        
-        for row, opp in enumerate(opportunities):
-            # Triangle
-            triangle_text = f"{opp.pair1[:3]}-{opp.pair2[:3]}-{opp.pair3[:3]}"
-            self.setItem(row, 0, QTableWidgetItem(triangle_text))
-            
-            # Direction
-            direction_item = QTableWidgetItem(opp.direction.upper())
-            if opp.direction == "forward":
-                direction_item.setForeground(QColor(PhoenixStyle.SUCCESS))
-            else:
-                direction_item.setForeground(QColor(PhoenixStyle.WARNING))
-            self.setItem(row, 1, direction_item)
-            
-            # Profit (Pips)
-            profit_item = QTableWidgetItem(f"{opp.profit_pips:.1f}")
-            if opp.profit_pips > 0:
-                profit_item.setForeground(QColor(PhoenixStyle.SUCCESS))
-            else:
-                profit_item.setForeground(QColor(PhoenixStyle.ERROR))
-            self.setItem(row, 2, profit_item)
-            
-            # Spread Cost
-            self.setItem(row, 3, QTableWidgetItem(f"{opp.spread_cost:.1f}"))
-            
-            # Net Profit
-            net_item = QTableWidgetItem(f"{opp.net_profit:.1f}")
-            if opp.net_profit > 0:
-                net_item.setForeground(QColor(PhoenixStyle.SUCCESS))
-            else:
-                net_item.setForeground(QColor(PhoenixStyle.ERROR))
-            self.setItem(row, 4, net_item)
-            
-            # Confidence
-            confidence_item = QTableWidgetItem(f"{opp.confidence:.0%}")
-            self.setItem(row, 5, confidence_item)
-            
-            # Status
-            status_item = QTableWidgetItem("READY" if opp.is_executable else "WAIT")
-            if opp.is_executable:
-                status_item.setForeground(QColor(PhoenixStyle.SUCCESS))
-            else:
-                status_item.setForeground(QColor(PhoenixStyle.TEXT_SECONDARY))
-            self.setItem(row, 6, status_item)
+        self.opportunity_model.update_opportunities(opportunities)
 
-class PositionTable(QTableWidget):
+class PositionTable(QTableView):
     """Table for displaying active positions"""
     
     def __init__(self, parent=None):
@@ -503,95 +818,92 @@ class PositionTable(QTableWidget):
         
     def setup_table(self):
         """Setup table structure"""
-        headers = ["Ticket", "Symbol", "Type", "Volume", "Open Price", "Current Price", "Profit", "Pips", "Time"]
-        self.setColumnCount(len(headers))
-        self.setHorizontalHeaderLabels(headers)
+        self.position_model = PositionModel(self)
+        self.setModel(self.position_model)
         
         # Set column widths
         for i, width in enumerate([80, 80, 60, 80, 100, 100, 100, 80, 120]):
             self.setColumnWidth(i, width)
         
         self.setAlternatingRowColors(True)
-        self.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        
+        # Fixed geometry so painting only touches visible rows
+        self.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.verticalHeader().setDefaultSectionSize(24)
+        self.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
         
     def update_positions(self, positions: List):
         """Update table with current positions"""
-        self.setRowCount(len(positions))
-        
-        for row, pos in enumerate(positions):
-            # Ticket
-            self.setItem(row, 0, QTableWidgetItem(str(pos.ticket)))
-            
-            # Symbol
-            self.setItem(row, 1, QTableWidgetItem(pos.symbol))
-            
-            # Type
-            type_item = QTableWidgetItem(pos.type.upper())
-            if pos.type == "buy":
-                type_item.setForeground(QColor(PhoenixStyle.SUCCESS))
-            else:
-                type_item.setForeground(QColor(PhoenixStyle.ERROR))
-            self.setItem(row, 2, type_item)
-            
-            # Volume
-            self.setItem(row, 3, QTableWidgetItem(f"{pos.volume:.2f}"))
-            
-            # Open Price
-            self.setItem(row, 4, QTableWidgetItem(f"{pos.open_price:.5f}"))
-            
-            # Current Price
-            self.setItem(row, 5, QTableWidgetItem(f"{pos.current_price:.5f}"))
-            
-            # Profit
-            profit_item = QTableWidgetItem(f"${pos.profit:.2f}")
-            if pos.profit > 0:
-                profit_item.setForeground(QColor(PhoenixStyle.SUCCESS))
-            else:
-                profit_item.setForeground(QColor(PhoenixStyle.ERROR))
-            self.setItem(row, 6, profit_item)
-            
-            # Pips (simplified calculation)
-            pips = (pos.current_price - pos.open_price) * 10000
-            if pos.type == "sell":
-                pips = -pips
-            pips_item = QTableWidgetItem(f"{pips:.1f}")
-            if pips > 0:
-                pips_item.setForeground(QColor(PhoenixStyle.SUCCESS))
-            else:
-                pips_item.setForeground(QColor(PhoenixStyle.ERROR))
-            self.setItem(row, 7, pips_item)
+        self.position_model.update_positions(positions)
+
+class EngineEventBridge(QObject):
+    """Relays engine change callbacks to the GUI thread as a Qt signal"""
+    
+    changed = pyqtSignal(str)
+    
+    def notify(self, kind: str):
+        """Engine change listener"""
+        self.changed.emit(kind)
+
+class LogModel(QAbstractListModel):
+    """Ring-buffer list model for activity log entries"""
+    
+    COLORS = {
+        "INFO": _COL_PRIMARY,
+        "SUCCESS": _COL_SUCCESS,
+        "WARNING": _COL_WARNING,
+        "ERROR": _COL_ERROR
+    }
+    
+    def __init__(self, max_entries: int = 1000, parent=None):
+        super().__init__(parent)
+        self._entries = deque(maxlen=max_entries)  # (text, color) tuples
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._entries)
+        
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._entries[index.row()][0]
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return self._entries[index.row()][1]
+        return None
+        
+    def append_entry(self, text: str, level: str):
+        """Append an entry, dropping the oldest one when the buffer is full"""
+        if len(self._entries) == self._entries.maxlen:
+            self.beginRemoveRows(QModelIndex(), 0, 0)
+            self._entries.popleft()
+            self.endRemoveRows()
             
-            # Time
-            time_str = pos.open_time.strftime("%H:%M:%S")
-            self.setItem(row, 8, QTableWidgetItem(time_str))
+        # Resolve the row's color now so painting never looks it up
+        color = self.COLORS.get(level, _COL_PRIMARY)
+        
+        row = len(self._entries)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._entries.append((text, color))
+        self.endInsertRows()
 
-class ActivityLog(QTextEdit):
+class ActivityLog(QListView):
     """Activity log widget"""
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setReadOnly(True)
-        self.setMaximumBlockCount(1000)  # Limit to 1000 lines
+        self.log_model = LogModel(1000, self)  # Limit to 1000 lines
+        self.setModel(self.log_model)
+        self.setUniformItemSizes(True)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         
     def add_log(self, message: str, level: str = "INFO"):
         """Add log message"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        
-        colors = {
-            "INFO": PhoenixStyle.TEXT_PRIMARY,
-            "SUCCESS": PhoenixStyle.SUCCESS,
-            "WARNING": PhoenixStyle.WARNING,
-            "ERROR": PhoenixStyle.ERROR
-        }
-        
-        color = colors.get(level, PhoenixStyle.TEXT_PRIMARY)
-        
-        formatted_message = f'<span style="color: {color}">[{timestamp}] {message}</span>'
-        self.append(formatted_message)
+        timestamp = _log_timestamp()
+        self.log_model.append_entry(f"[{timestamp}] {message}", level)
         
         # Auto-scroll to bottom
-        scrollbar = self.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+        self.scrollToBottom()
 
 class PhoenixDashboard(QMainWindow):
     """
@@ -600,12 +912,13 @@ class PhoenixDashboard(QMainWindow):
     Modern trading interface with real-time monitoring and control
     """
     
-    def __init__(self, arbitrage_engine=None, recovery_system=None, profit_harvester=None):
+    def __init__(self, pair_scanner=None, arbitrage_engine=None, recovery_system=None, profit_harvester=None):
         super().__init__()
         
         self.logger = logging.getLogger("PhoenixDashboard")
         
-        # Core components
+        # Core components; the scanner defaults to the engine's own
+        self.pair_scanner = pair_scanner or getattr(arbitrage_engine, 'pair_scanner', None)
         self.arbitrage_engine = arbitrage_engine
         self.recovery_system = recovery_system
         self.profit_harvester = profit_harvester
@@ -613,6 +926,41 @@ class PhoenixDashboard(QMainWindow):
         # UI state
         self.is_trading = False
         
+        # Running component start() tasks, one per trading component
+        self._component_tasks: List[asyncio.Task] = []
+        
+        # Last status bar / connection label contents, to skip repaints
+        self._last_status_msg = ""
+        self._last_connection_label = None
+        
+        # Widgets of lazily built tabs
+        self.positions_table = None
+        self.recovery_status = None
+        self.recovery_progress = None
+        
+        # Last rendered engine state, used to skip unchanged refreshes
+        self._last_metrics = None
+        self._last_recovery = None
+        self._opportunities_revision = -1
+        self._positions_revision = -1
+        
+        # Component query results shared by all updates of one timer tick
+        self._tick_cache = {}
+        
+        # Engine change events since the last flush, applied once per event loop pass
+        self._dirty_opps = False
+        self._dirty_positions = False
+        self._flush_pending = False
+        
+        # Held while the dashboard refreshes, so refreshes never overlap
+        self._update_mutex = QMutex()
+        
+        # Safety-net resync cadence; engine change events drive regular refreshes.
+        # Stretched to 1.2x the average refresh cost under load.
+        self._target_ms = 5000
+        self._tick_ewma_ms = 0.0
+        self._last_connection_check = 0.0
+        
         # Setup UI
         self.setup_ui()
         self.setup_timers()
@@ -655,7 +1003,7 @@ class PhoenixDashboard(QMainWindow):
         main_layout.addWidget(content_splitter)
         
         # Status bar
-        self.statusBar().showMessage("Phoenix Dashboard Ready")
+        self.show_status_message("Phoenix Dashboard Ready")
     
     def create_header(self):
         """Create header layout"""
@@ -698,6 +1046,7 @@ class PhoenixDashboard(QMainWindow):
         self.control_panel.start_trading.connect(self.start_trading)
         self.control_panel.stop_trading.connect(self.stop_trading)
         self.control_panel.pause_trading.connect(self.pause_trading)
+        self.control_panel.resume_trading.connect(self.resume_trading)
         layout.addWidget(self.control_panel)
         
         # Metrics Grid
@@ -745,10 +1094,31 @@ class PhoenixDashboard(QMainWindow):
         
         tab_widget.addTab(opportunities_tab, "Opportunities")
         
-        # Positions Tab
-        positions_tab = QWidget()
-        pos_layout = QVBoxLayout(positions_tab)
+        # Remaining tabs start as empty pages and are built on first view
+        self._tab_builders = {}
+        for title, builder in (
+            ("Positions", self._build_positions_tab),
+            ("Recovery", self._build_recovery_tab),
+            ("Charts", self._build_charts_tab)
+        ):
+            page = QWidget()
+            QVBoxLayout(page)
+            index = tab_widget.addTab(page, title)
+            self._tab_builders[index] = builder
+        
+        tab_widget.currentChanged.connect(self._ensure_tab_built)
+        self.tab_widget = tab_widget
         
+        return tab_widget
+    
+    def _ensure_tab_built(self, index: int):
+        """Build a lazily constructed tab the first time it is shown"""
+        builder = self._tab_builders.pop(index, None)
+        if builder:
+            builder(self.tab_widget.widget(index).layout())
+    
+    def _build_positions_tab(self, pos_layout):
+        """Populate the positions tab"""
         pos_header = QLabel("📈 Active Positions")
         pos_header.setProperty("class", "title")
         pos_layout.addWidget(pos_header)
@@ -756,12 +1126,13 @@ class PhoenixDashboard(QMainWindow):
         self.positions_table = PositionTable()
         pos_layout.addWidget(self.positions_table)
         
-        tab_widget.addTab(positions_tab, "Positions")
-        
-        # Recovery Tab
-        recovery_tab = QWidget()
-        rec_layout = QVBoxLayout(recovery_tab)
-        
+        # Fill the new table now with fresh positions, not on the next timer tick
+        self._positions_revision = -1
+        self._tick_cache.pop('positions', None)
+        self.update_tables()
+    
+    def _build_recovery_tab(self, rec_layout):
+        """Populate the recovery tab"""
         rec_header = QLabel("🔄 Recovery System")
         rec_header.setProperty("class", "title")
         rec_layout.addWidget(rec_header)
@@ -775,13 +1146,11 @@ class PhoenixDashboard(QMainWindow):
         rec_layout.addWidget(self.recovery_progress)
         
         rec_layout.addStretch()
-        
-        tab_widget.addTab(recovery_tab, "Recovery")
-        
-        # Charts Tab
-        charts_tab = QWidget()
-        charts_layout = QVBoxLayout(charts_tab)
-        
+    
+    def _build_charts_tab(self, charts_layout):
+        """Populate the charts tab"""
+        # Import matplotlib (FigureCanvasQTAgg, Figure) here rather than at module
+        # level when real charts land, so startup never pays for it
         charts_header = QLabel("📊 Performance Charts")
         charts_header.setProperty("class", "title")
         charts_layout.addWidget(charts_header)
@@ -791,88 +1160,171 @@ class PhoenixDashboard(QMainWindow):
         chart_placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
         chart_placeholder.setStyleSheet(f"color: {PhoenixStyle.TEXT_SECONDARY}; font-size: 16px;")
         charts_layout.addWidget(chart_placeholder)
-        
-        tab_widget.addTab(charts_tab, "Charts")
-        
-        return tab_widget
+    
+    def show_status_message(self, message: str):
+        """Show a status bar message, skipping repeats"""
+        if message != self._last_status_msg:
+            self._last_status_msg = message
+            self.statusBar().showMessage(message)
     
     def setup_timers(self):
-        """Setup update timers"""
-        # Main update timer
+        """Setup the update timer (started while the window is shown) and engine events"""
+        # One timer drives both refreshes and connection checks
         self.update_timer = QTimer()
+        self.update_timer.setInterval(self._target_ms)
         self.update_timer.timeout.connect(self.update_dashboard)
-        self.update_timer.start(1000)  # Update every second
         
-        # Connection check timer
-        self.connection_timer = QTimer()
-        self.connection_timer.timeout.connect(self.check_connection)
-        self.connection_timer.start(5000)  # Check every 5 seconds
+        # Engine change events (queued to the GUI thread when emitted elsewhere)
+        self.engine_events = EngineEventBridge(self)
+        self.engine_events.changed.connect(self._on_engine_changed)
+        if self.arbitrage_engine and hasattr(self.arbitrage_engine, 'add_change_listener'):
+            self.arbitrage_engine.add_change_listener(self.engine_events.notify)
+    
+    def showEvent(self, event):
+        """Resume refreshing when the window becomes visible"""
+        super().showEvent(event)
+        self.update_timer.start()
     
-    def start_trading(self):
+    def hideEvent(self, event):
+        """Stop refreshing while the window is hidden or minimized"""
+        super().hideEvent(event)
+        self.update_timer.stop()
+    
+    @asyncSlot()
+    async def start_trading(self):
         """Start trading system"""
         try:
             self.logger.info("🚀 Starting trading system from GUI...")
             self.is_trading = True
             
-            # Start engines if available
-            if self.arbitrage_engine:
-                asyncio.create_task(self.arbitrage_engine.start())
-            
-            if self.recovery_system:
-                asyncio.create_task(self.recovery_system.start())
+            # The engine refuses to start without a broker, so connect first;
+            # initialize() offloads only the MT5 handshake to an executor
+            if self.pair_scanner and not self.pair_scanner.is_connected:
+                self.activity_log.add_log("🔗 Connecting to broker...", "INFO")
+                self.show_status_message("Connecting to broker...")
+                await self.pair_scanner.initialize()
             
-            if self.profit_harvester:
-                asyncio.create_task(self.profit_harvester.start())
+            # Components run until stopped; keep their tasks so stop can reach them
+            components = [
+                component for component in
+                (self.arbitrage_engine, self.recovery_system, self.profit_harvester)
+                if component
+            ]
+            self._component_tasks = [
+                asyncio.create_task(component.start()) for component in components
+            ]
+            for task in self._component_tasks:
+                task.add_done_callback(self._on_component_done)
             
             self.activity_log.add_log("🚀 Trading system started", "SUCCESS")
-            self.statusBar().showMessage("Trading Active")
-            
+            self.show_status_message("Trading Active")
+        
         except Exception as e:
             self.logger.error(f"❌ Failed to start trading: {e}")
             self.activity_log.add_log(f"❌ Failed to start trading: {e}", "ERROR")
+            self.is_trading = False
             self.control_panel.set_trading_state(False)
     
-    def stop_trading(self):
+    @asyncSlot()
+    async def stop_trading(self):
         """Stop trading system"""
         try:
             self.logger.info("🛑 Stopping trading system from GUI...")
             self.is_trading = False
             
-            # Stop engines if available
-            if self.arbitrage_engine:
-                asyncio.create_task(self.arbitrage_engine.stop())
-            
-            if self.recovery_system:
-                asyncio.create_task(self.recovery_system.stop())
-            
-            if self.profit_harvester:
-                asyncio.create_task(self.profit_harvester.stop())
+            await self._stop_components()
             
             self.activity_log.add_log("🛑 Trading system stopped", "WARNING")
-            self.statusBar().showMessage("Trading Stopped")
+            self.show_status_message("Trading Stopped")
             
         except Exception as e:
             self.logger.error(f"❌ Failed to stop trading: {e}")
             self.activity_log.add_log(f"❌ Failed to stop trading: {e}", "ERROR")
     
-    def pause_trading(self):
+    async def _stop_components(self):
+        """Stop engines if available and cancel their start() tasks"""
+        tasks, self._component_tasks = self._component_tasks, []
+        
+        if self.arbitrage_engine:
+            await self.arbitrage_engine.stop()
+        
+        if self.recovery_system:
+            await self.recovery_system.stop()
+        
+        if self.profit_harvester:
+            await self.profit_harvester.stop()
+        
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+    
+    def _on_component_done(self, task: asyncio.Task):
+        """Cancel the sibling components when one of them fails"""
+        if task.cancelled() or task.exception() is None or task not in self._component_tasks:
+            return
+        
+        error = task.exception()
+        tasks, self._component_tasks = self._component_tasks, []
+        for sibling in tasks:
+            sibling.cancel()
+        
+        self.logger.error(f"❌ Trading component failed: {error}")
+        self.activity_log.add_log(f"❌ Trading component failed: {error}", "ERROR")
+        self.is_trading = False
+        self.control_panel.set_trading_state(False)
+        self.show_status_message("Trading Stopped")
+    
+    @asyncSlot()
+    async def pause_trading(self):
         """Pause trading system"""
         try:
             self.logger.info("⏸️ Pausing trading system...")
             
             if self.arbitrage_engine:
-                asyncio.create_task(self.arbitrage_engine.pause())
+                await self.arbitrage_engine.pause()
             
             self.activity_log.add_log("⏸️ Trading system paused", "WARNING")
-            self.statusBar().showMessage("Trading Paused")
+            self.show_status_message("Trading Paused")
             
         except Exception as e:
             self.logger.error(f"❌ Failed to pause trading: {e}")
             self.activity_log.add_log(f"❌ Failed to pause trading: {e}", "ERROR")
     
+    @asyncSlot()
+    async def resume_trading(self):
+        """Resume the paused trading system"""
+        try:
+            if all(task.done() for task in self._component_tasks):
+                self.activity_log.add_log("⚠️ Trading is not running, nothing to resume", "WARNING")
+                self.control_panel.set_trading_state(False)
+                return
+            
+            self.logger.info("▶️ Resuming trading system...")
+            
+            if self.arbitrage_engine:
+                await self.arbitrage_engine.resume()
+            
+            self.activity_log.add_log("▶️ Trading system resumed", "SUCCESS")
+            self.show_status_message("Trading Active")
+            
+        except Exception as e:
+            self.logger.error(f"❌ Failed to resume trading: {e}")
+            self.activity_log.add_log(f"❌ Failed to resume trading: {e}", "ERROR")
+    
     def update_dashboard(self):
         """Update dashboard with current data"""
+        if not self.isVisible() or self.isMinimized():
+            return
+        
+        if not self._update_mutex.tryLock():
+            return
+        
+        start = time.perf_counter()
         try:
+            # Fresh component queries for this tick
+            self._tick_cache.clear()
+            
             # Update metrics
             self.update_metrics()
             
@@ -882,8 +1334,65 @@ class PhoenixDashboard(QMainWindow):
             # Update recovery status
             self.update_recovery_status()
             
+            # Check connection every _CONNECTION_CHECK_SECONDS
+            now = time.monotonic()
+            if now - self._last_connection_check >= _CONNECTION_CHECK_SECONDS:
+                self._last_connection_check = now
+                self.check_connection()
+        
+        except Exception as e:
+            self.logger.error(f"❌ Dashboard update failed: {e}")
+        finally:
+            self._update_mutex.unlock()
+        
+        # Never schedule faster than the dashboard can refresh
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self._tick_ewma_ms += _TICK_EWMA_ALPHA * (elapsed_ms - self._tick_ewma_ms)
+        interval = max(self._target_ms, int(self._tick_ewma_ms * 1.2))
+        if interval != self.update_timer.interval():
+            self.update_timer.setInterval(interval)
+    
+    def _on_engine_changed(self, kind: str):
+        """Mark the changed data dirty and schedule one flush for the burst"""
+        if kind == 'positions':
+            self._dirty_positions = True
+        else:
+            self._dirty_opps = True
+        
+        if not self._flush_pending:
+            self._flush_pending = True
+            QTimer.singleShot(0, self._flush_if_dirty)
+    
+    def _flush_if_dirty(self):
+        """Refresh metrics and tables once for all changes since the last flush"""
+        self._flush_pending = False
+        if not (self._dirty_opps or self._dirty_positions):
+            return
+        self._dirty_opps = self._dirty_positions = False
+        
+        if not self.isVisible() or self.isMinimized():
+            return
+        
+        if not self._update_mutex.tryLock():
+            return
+        
+        try:
+            # update_tables compares engine revisions, so it only redraws dirty tables
+            self._tick_cache.clear()
+            self.update_metrics()
+            self.update_tables()
         except Exception as e:
             self.logger.error(f"❌ Dashboard update failed: {e}")
+        finally:
+            self._update_mutex.unlock()
+    
+    def _cached(self, key: str, fn):
+        """Call a component query once per tick and share the result"""
+        try:
+            return self._tick_cache[key]
+        except KeyError:
+            result = self._tick_cache[key] = fn()
+            return result
     
     def update_metrics(self):
         """Update performance metrics"""
@@ -894,15 +1403,20 @@ class PhoenixDashboard(QMainWindow):
             positions_count = 0
             
             if self.arbitrage_engine:
-                status = self.arbitrage_engine.get_status()
+                status = self._cached('engine_status', self.arbitrage_engine.get_status)
                 opportunities_count = status.get('opportunities_found', 0)
                 success_rate = status.get('success_rate', 0.0)
                 total_profit = status.get('total_profit', 0.0)
                 positions_count = status.get('active_positions', 0)
             
+            metrics = (total_profit, opportunities_count, success_rate, positions_count)
+            if metrics == self._last_metrics:
+                return
+            self._last_metrics = metrics
+            
             # Update cards
-            profit_color = PhoenixStyle.SUCCESS if total_profit >= 0 else PhoenixStyle.ERROR
-            self.profit_card.update_value(f"${total_profit:.2f}", profit_color)
+            profit_state = "positive" if total_profit >= 0 else "negative"
+            self.profit_card.update_value(f"${total_profit:.2f}", profit_state)
             
             self.opportunities_card.update_value(str(opportunities_count))
             self.success_rate_card.update_value(f"{success_rate:.1f}%")
@@ -916,12 +1430,19 @@ class PhoenixDashboard(QMainWindow):
         try:
             # Update opportunities table
             if self.arbitrage_engine:
-                opportunities = self.arbitrage_engine.get_opportunities()
-                self.opportunities_table.update_opportunities(opportunities)
+                engine = self.arbitrage_engine
+                
+                if engine.opportunities_revision != self._opportunities_revision:
+                    self._opportunities_revision = engine.opportunities_revision
+                    self.opportunities_table.update_opportunities(
+                        self._cached('opportunities', engine.get_opportunities))
                 
                 # Update positions table
-                positions = self.arbitrage_engine.get_positions()
-                self.positions_table.update_positions(positions)
+                if (self.positions_table is not None and
+                    engine.positions_revision != self._positions_revision):
+                    self._positions_revision = engine.positions_revision
+                    self.positions_table.update_positions(
+                        self._cached('positions', engine.get_positions))
             
         except Exception as e:
             self.logger.error(f"❌ Tables update failed: {e}")
@@ -929,8 +1450,8 @@ class PhoenixDashboard(QMainWindow):
     def update_recovery_status(self):
         """Update recovery system status"""
         try:
-            if self.recovery_system:
-                status = self.recovery_system.get_status()
+            if self.recovery_system and self.recovery_status is not None:
+                status = self._cached('recovery_status', self.recovery_system.get_status)
                 recovery_status = status.get('status', 'inactive')
                 active_recoveries = status.get('active_recoveries', 0)
                 success_rate = status.get('success_rate', 0.0)
@@ -939,8 +1460,11 @@ class PhoenixDashboard(QMainWindow):
                 if active_recoveries > 0:
                     status_text += f" ({active_recoveries} active)"
                 
-                self.recovery_status.setText(status_text)
-                self.recovery_progress.setValue(int(success_rate))
+                recovery = (status_text, int(success_rate))
+                if recovery != self._last_recovery:
+                    self._last_recovery = recovery
+                    self.recovery_status.setText(status_text)
+                    self.recovery_progress.setValue(recovery[1])
             
         except Exception as e:
             self.logger.error(f"❌ Recovery status update failed: {e}")
@@ -950,20 +1474,20 @@ class PhoenixDashboard(QMainWindow):
         try:
             is_connected = False
             
-            if (self.arbitrage_engine and 
-                hasattr(self.arbitrage_engine, 'pair_scanner') and
-                self.arbitrage_engine.pair_scanner):
-                
-                connection_status = self.arbitrage_engine.pair_scanner.get_connection_status()
+            if self.pair_scanner:
+                connection_status = self.pair_scanner.get_connection_status()
                 is_connected = connection_status.get('is_connected', False)
                 status_text = connection_status.get('status', 'Unknown')
                 
-                if is_connected:
-                    self.connection_status.setText(f"🟢 {status_text}")
-                    self.connection_status.setStyleSheet(f"color: {PhoenixStyle.SUCCESS}")
-                else:
-                    self.connection_status.setText(f"🔴 {status_text}")
-                    self.connection_status.setStyleSheet(f"color: {PhoenixStyle.ERROR}")
+                connection_label = (is_connected, status_text)
+                if connection_label != self._last_connection_label:
+                    self._last_connection_label = connection_label
+                    if is_connected:
+                        self.connection_status.setText(f"🟢 {status_text}")
+                        self.connection_status.setStyleSheet(_CONNECTED_STYLE)
+                    else:
+                        self.connection_status.setText(f"🔴 {status_text}")
+                        self.connection_status.setStyleSheet(_DISCONNECTED_STYLE)
                 
                 # Update control panel
                 self.control_panel.set_connection_status(is_connected)
@@ -989,14 +1513,14 @@ class PhoenixDashboard(QMainWindow):
         """Stop the dashboard"""
         self.logger.info("🖥️ Stopping Phoenix Dashboard...")
         
-        # Stop timers
+        # Stop timer
         self.update_timer.stop()
-        self.connection_timer.stop()
         
         # Close window
         self.close()
     
-    def closeEvent(self, event):
+    @asyncClose
+    async def closeEvent(self, event):
         """Handle window close event"""
         if self.is_trading:
             reply = QMessageBox.question(
@@ -1008,7 +1532,8 @@ class PhoenixDashboard(QMainWindow):
             )
             
             if reply == QMessageBox.StandardButton.Yes:
-                self.stop_trading()
+                self.is_trading = False
+                await self._stop_components()
                 event.accept()
             else:
                 event.ignore()
@@ -1019,11 +1544,16 @@ def main():
     """Main function for testing the dashboard"""
     app = QApplication(sys.argv)
     
+    # Share one event loop between Qt and asyncio
+    loop = QEventLoop(app)
+    asyncio.set_event_loop(loop)
+    
     # Create and show dashboard
     dashboard = PhoenixDashboard()
     dashboard.show()
     
-    sys.exit(app.exec())
+    with loop:
+        loop.run_forever()
 
 if __name__ == "__main__":
     main()
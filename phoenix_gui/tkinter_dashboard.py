@@ -5,12 +5,194 @@ GUI Dashboard using tkinter (built-in Python GUI)
 """
 
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import ttk, scrolledtext, messagebox
-import threading
 import asyncio
+import concurrent.futures
+import queue
+import threading
 import time
+import math
+from collections import deque
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple, Callable
+
+# Smoothing factor for the measured refresh cost
+_TICK_EWMA_ALPHA = 0.2
+
+# Lines kept in the activity log
+_MAX_LOG_LINES = 100
+
+# Refresh interval while the engine is not running
+_IDLE_INTERVAL_MS = 10000
+
+# Full refresh interval when no engine change notices arrive
+_RESYNC_SECONDS = 5.0
+_ALL_CHANGES = frozenset(('status', 'opportunities', 'positions'))
+
+# Shortest delay for a deferred render
+_MIN_DEFER_MS = 5
+
+# Most posted widget updates applied per wakeup, so a burst cannot stall the GUI
+_GUI_DRAIN_BATCH = 100
+
+# Treeview rows applied per idle callback, so input is handled between batches
+_SYNC_BATCH = 20
+
+# Pre-bound number formatters for the refresh hot path
+_FMT_PIPS = "{:.1f}".format
+_FMT_CONFIDENCE = "{:.1%}".format
+_FMT_RATE = "{:.1f}%".format
+_FMT_USD = "${:.2f}".format
+_FMT_VOLUME = "{:.2f}".format
+_FMT_PRICE = "{:.5f}".format
+
+def _format_opportunity(opp) -> tuple:
+    """Treeview values for an opportunity"""
+    return (
+        f"{opp.pair1}-{opp.pair2}-{opp.pair3}",
+        _FMT_PIPS(opp.profit_pips),
+        _FMT_PIPS(opp.spread_cost),
+        _FMT_PIPS(opp.net_profit),
+        _FMT_CONFIDENCE(opp.confidence)
+    )
+
+def _format_position(pos) -> tuple:
+    """Treeview values for a position"""
+    return (
+        pos.symbol,
+        pos.type,
+        _FMT_VOLUME(pos.volume),
+        _FMT_PRICE(pos.open_price),
+        _FMT_PRICE(pos.current_price),
+        _FMT_USD(pos.profit)
+    )
+
+class TreeviewRows:
+    """
+    Keyed rows of a Treeview, updated by diff
+    
+    Only rows inside the viewport are reformatted on refresh; rows scrolled
+    out of view keep their record and are formatted when scrolled back in.
+    """
+    
+    def __init__(self, tree: ttk.Treeview, format_row: Callable[[Any], tuple], prealloc: int = 0):
+        self.tree = tree
+        self.format_row = format_row
+        self.iids: Dict[tuple, str] = {}
+        self.shown: Dict[tuple, tuple] = {}
+        self.records: Dict[tuple, Any] = {}
+        self.order: List[tuple] = []
+        self.stale: Dict[tuple, Any] = {}
+        self.spare: List[str] = []  # detached items, reused for new rows
+        self._pump_id = None
+        
+        # Create the expected number of items up front; the pool grows on demand
+        if prealloc:
+            self.spare = [tree.insert('', 'end', values=()) for _ in range(prealloc)]
+            tree.detach(*self.spare)
+    
+    def _visible_range(self, first: float, last: float, count: int) -> Tuple[int, int]:
+        """Row index range covered by the yview fractions"""
+        return int(first * count), math.ceil(last * count)
+    
+    def _show(self, key: tuple, record):
+        """Show a record, skipping the format call when it has not changed"""
+        if self.records[key] == record:
+            return
+        self.records[key] = record
+        
+        values = self.format_row(record)
+        if self.shown[key] != values:
+            self.tree.item(self.iids[key], values=values)
+            self.shown[key] = values
+    
+    def sync(self, rows: List[Tuple[tuple, Any]]):
+        """Apply (key, record) rows, touching only changed items
+        
+        Large updates are applied in batches of _SYNC_BATCH rows from
+        after_idle callbacks; a newer sync supersedes an unfinished one.
+        """
+        self.cancel()
+        self._pump(self._sync_steps(rows))
+    
+    def _pump(self, steps):
+        """Run one batch and schedule the next while the update is unfinished"""
+        self._pump_id = None
+        if next(steps, False):
+            self._pump_id = self.tree.after_idle(self._pump, steps)
+    
+    def cancel(self):
+        """Drop an unfinished batched update"""
+        if self._pump_id is not None:
+            self.tree.after_cancel(self._pump_id)
+            self._pump_id = None
+    
+    def _sync_steps(self, rows: List[Tuple[tuple, Any]]):
+        """Generator applying rows; self.order matches the tree at every yield"""
+        new_rows = {}
+        for key, record in rows:
+            new_rows.setdefault(key, record)  # first occurrence wins
+        
+        # Detach vanished rows in one call and keep their items for reuse
+        vanished = [key for key in self.iids if key not in new_rows]
+        if vanished:
+            detached = [self.iids.pop(key) for key in vanished]
+            self.tree.detach(*detached)
+            self.spare.extend(detached)
+            for key in vanished:
+                del self.shown[key]
+                del self.records[key]
+                self.stale.pop(key, None)
+        current = self.order = [key for key in self.order if key in new_rows]
+        
+        start, end = self._visible_range(*self.tree.yview(), len(new_rows))
+        for index, (key, record) in enumerate(new_rows.items()):
+            if index and index % _SYNC_BATCH == 0:
+                yield True
+            
+            if key not in self.iids:
+                values = self.format_row(record)
+                if self.spare:
+                    iid = self.spare.pop()
+                    self.tree.item(iid, values=values)
+                    self.tree.move(iid, '', index)
+                else:
+                    iid = self.tree.insert('', index, values=values)
+                self.iids[key] = iid
+                self.shown[key] = values
+                self.records[key] = record
+                current.insert(index, key)
+                continue
+            
+            if start <= index < end:
+                self.stale.pop(key, None)
+                self._show(key, record)
+            else:
+                self.stale[key] = record
+            
+            if current[index] != key:
+                self.tree.move(self.iids[key], '', index)
+                current.remove(key)
+                current.insert(index, key)
+    
+    def refresh_visible(self, first: float, last: float):
+        """Format stale rows that scrolled into view"""
+        if not self.stale:
+            return
+        
+        start, end = self._visible_range(first, last, len(self.order))
+        for key in self.order[start:end]:
+            record = self.stale.pop(key, None)
+            if record is not None:
+                self._show(key, record)
+    
+    def yscrollcommand(self, scrollbar: ttk.Scrollbar) -> Callable:
+        """yscrollcommand that updates the scrollbar and formats newly visible rows"""
+        def on_scroll(first, last):
+            scrollbar.set(first, last)
+            self.refresh_visible(float(first), float(last))
+        return on_scroll
 
 class PhoenixTkinterDashboard:
     """
@@ -19,6 +201,23 @@ class PhoenixTkinterDashboard:
     Cross-platform GUI that works without external dependencies
     """
     
+    # Shared button colours, spread into tk.Button(...)
+    BTN_BLUE = {'bg': '#0066cc', 'fg': 'white'}
+    BTN_GREY = {'bg': '#666666', 'fg': 'white'}
+    BTN_GREEN = {'bg': '#00aa00', 'fg': 'white'}
+    BTN_RED = {'bg': '#aa0000', 'fg': 'white'}
+    
+    # Named fonts created once per window: name -> (family, size, weight)
+    FONTS = {
+        'title': ('Arial', 16, 'bold'),
+        'heading': ('Arial', 12, 'bold'),
+        'button': ('Arial', 11, 'bold'),
+        'label_bold': ('Arial', 10, 'bold'),
+        'label': ('Arial', 10, 'normal'),
+        'table': ('Arial', 9, 'normal'),
+        'log': ('Consolas', 9, 'normal'),
+    }
+    
     def __init__(self, pair_scanner=None, arbitrage_engine=None, recovery_system=None, profit_harvester=None):
         """Initialize tkinter dashboard"""
         self.pair_scanner = pair_scanner
@@ -29,7 +228,58 @@ class PhoenixTkinterDashboard:
         # GUI components
         self.root = None
         self.is_running = False
-        self.update_thread = None
+        self.fonts: Dict[str, tkfont.Font] = {}
+        
+        # Refresh loop, rescheduled on the Tk main thread via root.after.
+        # The interval never drops below 1.2x the average refresh cost.
+        self._target_ms = 500
+        self._tick_ewma_ms = 0.0
+        self._after_id = None
+        
+        # Background loop for all broker and engine coroutines; their widget
+        # updates are posted to _gui_queue and applied on the Tk thread
+        self._engine_loop = None
+        self._gui_queue = queue.Queue()
+        self._wakeup_pending = False
+        
+        # Set while displays are refreshed, so refreshes never overlap (Tk thread only)
+        self._rendering = False
+        
+        # Engine data fetched on the engine thread; the GUI only renders from it
+        self._snapshot: Dict[str, Any] = {}
+        self._snapshot_lock = threading.Lock()
+        
+        # Redraw rate ceiling; renders requested sooner are merged and deferred
+        self._min_render_interval = 0.2
+        self._last_render = 0.0
+        self._pending_changes = set()
+        self._render_after_id = None
+        
+        # Cleared while the window is iconified, withdrawn or fully obscured
+        self._visible = True
+        self._mapped = True
+        self._obscured = False
+        
+        # Whether trading was started from this dashboard; Tk thread only
+        self._trading_running = False
+        
+        # Last engine status shown, to skip unchanged StringVar updates
+        self._status_snapshot = None
+        self._last_status: Dict[str, str] = {}
+        
+        # Diffed Treeview contents (created with the panels)
+        self.opp_rows = None
+        self.pos_rows = None
+        
+        # Log lines waiting to be written by the Tk main thread
+        self._log_queue = deque(maxlen=_MAX_LOG_LINES)
+        self._log_lines = 0
+        
+        # Engine change notices ('opportunities' / 'positions'), drained by _tick
+        self._change_queue = queue.Queue()
+        self._last_resync = 0.0
+        if arbitrage_engine and hasattr(arbitrage_engine, 'add_change_listener'):
+            arbitrage_engine.add_change_listener(self._change_queue.put)
         
         # Status variables (will be initialized in create_gui)
         self.connection_status = None
@@ -48,6 +298,18 @@ class PhoenixTkinterDashboard:
         self.root.geometry("1000x700")
         self.root.configure(bg='#2b2b2b')
         
+        # Track visibility so refreshes can be skipped while minimized
+        self.root.bind('<Map>', self._on_map, add='+')
+        self.root.bind('<Unmap>', self._on_unmap, add='+')
+        self.root.bind('<Visibility>', self._on_visibility, add='+')
+        
+        # Broker and engine coroutines run on their own thread so they never stall the GUI
+        self._engine_loop = asyncio.new_event_loop()
+        threading.Thread(target=self._engine_loop.run_forever, daemon=True).start()
+        
+        # Posted updates and log lines wake the Tk loop with a virtual event
+        self.root.bind('<<GuiQueue>>', self._on_gui_queue)
+        
         # Initialize status variables after root window is created
         self.connection_status = tk.StringVar(value="Disconnected")
         self.trading_status = tk.StringVar(value="Stopped")
@@ -58,35 +320,48 @@ class PhoenixTkinterDashboard:
         self.success_rate = tk.StringVar(value="0.0%")
         self.active_positions = tk.StringVar(value="0")
         
-        # Configure style
-        style = ttk.Style()
+        self._configure_styles()
+        
+        # Create main layout
+        self._create_header()
+        self._create_control_panel()
+        self._create_status_panel()
+        self._create_opportunities_panel()
+        self._create_positions_panel()
+        self._create_log_panel()
+        
+        return self.root
+    
+    def _configure_styles(self):
+        """Create the shared fonts and ttk styles for this window"""
+        self.fonts = {
+            name: tkfont.Font(self.root, family=family, size=size, weight=weight)
+            for name, (family, size, weight) in self.FONTS.items()
+        }
+        
+        style = ttk.Style(self.root)
         style.theme_use('clam')
         
         # Configure colors for dark theme
-        style.configure('Title.TLabel', 
-                       background='#2b2b2b', 
+        style.configure('Title.TLabel',
+                       background='#2b2b2b',
                        foreground='#ff6b35',
-                       font=('Arial', 16, 'bold'))
+                       font=self.fonts['title'])
         
         style.configure('Status.TLabel',
                        background='#2b2b2b',
                        foreground='#ffffff',
-                       font=('Arial', 10))
+                       font=self.fonts['label'])
         
         style.configure('Value.TLabel',
-                       background='#2b2b2b', 
+                       background='#2b2b2b',
                        foreground='#00ff00',
-                       font=('Arial', 12, 'bold'))
+                       font=self.fonts['heading'])
         
-        # Create main layout
-        self._create_header()
-        self._create_control_panel()
-        self._create_status_panel()
-        self._create_opportunities_panel()
-        self._create_positions_panel()
-        self._create_log_panel()
-        
-        return self.root
+        # Fixed row geometry for the data tables
+        style.configure('Treeview',
+                       rowheight=20,
+                       font=self.fonts['table'])
     
     def _create_header(self):
         """Create header section"""
@@ -122,19 +397,17 @@ class PhoenixTkinterDashboard:
         self.connect_button = tk.Button(conn_frame,
                                        text="🔗 Connect Broker",
                                        command=self._connect_broker,
-                                       bg='#0066cc',
-                                       fg='white',
-                                       font=('Arial', 10, 'bold'),
-                                       width=18)
+                                       font=self.fonts['label_bold'],
+                                       width=18,
+                                       **self.BTN_BLUE)
         self.connect_button.pack(side='left', padx=5)
         
         self.disconnect_button = tk.Button(conn_frame,
                                           text="❌ Disconnect",
                                           command=self._disconnect_broker,
-                                          bg='#666666',
-                                          fg='white',
-                                          font=('Arial', 10, 'bold'),
-                                          width=15)
+                                          font=self.fonts['label_bold'],
+                                          width=15,
+                                          **self.BTN_GREY)
         self.disconnect_button.pack(side='left', padx=5)
         
         # Connection status label
@@ -142,7 +415,7 @@ class PhoenixTkinterDashboard:
                                textvariable=self.connection_status,
                                bg='#2b2b2b',
                                fg='#ffff00',
-                               font=('Arial', 10, 'bold'))
+                               font=self.fonts['label_bold'])
         status_label.pack(side='left', padx=20)
         
         # Bottom row - Trading controls
@@ -152,28 +425,25 @@ class PhoenixTkinterDashboard:
         self.start_button = tk.Button(trade_frame,
                                      text="🚀 Start Trading",
                                      command=self._start_trading,
-                                     bg='#00aa00',
-                                     fg='white',
-                                     font=('Arial', 11, 'bold'),
-                                     width=15)
+                                     font=self.fonts['button'],
+                                     width=15,
+                                     **self.BTN_GREEN)
         self.start_button.pack(side='left', padx=5)
         
         self.stop_button = tk.Button(trade_frame,
                                     text="🛑 Stop Trading", 
                                     command=self._stop_trading,
-                                    bg='#aa0000',
-                                    fg='white',
-                                    font=('Arial', 11, 'bold'),
-                                    width=15)
+                                    font=self.fonts['button'],
+                                    width=15,
+                                    **self.BTN_RED)
         self.stop_button.pack(side='left', padx=5)
         
         self.refresh_button = tk.Button(trade_frame,
                                        text="🔄 Refresh",
                                        command=self._refresh_data,
-                                       bg='#0066cc',
-                                       fg='white', 
-                                       font=('Arial', 11, 'bold'),
-                                       width=15)
+                                       font=self.fonts['button'],
+                                       width=15,
+                                       **self.BTN_BLUE)
         self.refresh_button.pack(side='left', padx=5)
     
     def _create_status_panel(self):
@@ -182,7 +452,7 @@ class PhoenixTkinterDashboard:
                                     text="📊 System Status",
                                     bg='#2b2b2b',
                                     fg='#ffffff',
-                                    font=('Arial', 12, 'bold'))
+                                    font=self.fonts['heading'])
         status_frame.pack(fill='x', padx=10, pady=5)
         
         # Create grid for status items
@@ -212,7 +482,7 @@ class PhoenixTkinterDashboard:
                                  text="🎯 Current Opportunities",
                                  bg='#2b2b2b',
                                  fg='#ffffff',
-                                 font=('Arial', 12, 'bold'))
+                                 font=self.fonts['heading'])
         opp_frame.pack(fill='both', expand=True, padx=10, pady=5)
         
         # Create treeview for opportunities
@@ -222,11 +492,12 @@ class PhoenixTkinterDashboard:
         # Configure columns
         for col in columns:
             self.opp_tree.heading(col, text=col)
-            self.opp_tree.column(col, width=150, anchor='center')
+            self.opp_tree.column(col, width=150, minwidth=150, stretch=False, anchor='center')
         
         # Add scrollbar
         opp_scrollbar = ttk.Scrollbar(opp_frame, orient='vertical', command=self.opp_tree.yview)
-        self.opp_tree.configure(yscrollcommand=opp_scrollbar.set)
+        self.opp_rows = TreeviewRows(self.opp_tree, _format_opportunity, prealloc=10)
+        self.opp_tree.configure(yscrollcommand=self.opp_rows.yscrollcommand(opp_scrollbar))
         
         self.opp_tree.pack(side='left', fill='both', expand=True)
         opp_scrollbar.pack(side='right', fill='y')
@@ -237,7 +508,7 @@ class PhoenixTkinterDashboard:
                                  text="📈 Active Positions", 
                                  bg='#2b2b2b',
                                  fg='#ffffff',
-                                 font=('Arial', 12, 'bold'))
+                                 font=self.fonts['heading'])
         pos_frame.pack(fill='both', expand=True, padx=10, pady=5)
         
         # Create treeview for positions
@@ -247,11 +518,12 @@ class PhoenixTkinterDashboard:
         # Configure columns
         for col in columns:
             self.pos_tree.heading(col, text=col)
-            self.pos_tree.column(col, width=120, anchor='center')
+            self.pos_tree.column(col, width=120, minwidth=120, stretch=False, anchor='center')
         
         # Add scrollbar
         pos_scrollbar = ttk.Scrollbar(pos_frame, orient='vertical', command=self.pos_tree.yview)
-        self.pos_tree.configure(yscrollcommand=pos_scrollbar.set)
+        self.pos_rows = TreeviewRows(self.pos_tree, _format_position, prealloc=6)
+        self.pos_tree.configure(yscrollcommand=self.pos_rows.yscrollcommand(pos_scrollbar))
         
         self.pos_tree.pack(side='left', fill='both', expand=True)
         pos_scrollbar.pack(side='right', fill='y')
@@ -262,7 +534,7 @@ class PhoenixTkinterDashboard:
                                  text="📝 Activity Log",
                                  bg='#2b2b2b', 
                                  fg='#ffffff',
-                                 font=('Arial', 12, 'bold'))
+                                 font=self.fonts['heading'])
         log_frame.pack(fill='both', expand=True, padx=10, pady=5)
         
         # Create scrolled text widget for logs
@@ -270,7 +542,8 @@ class PhoenixTkinterDashboard:
                                                  height=8,
                                                  bg='#1e1e1e',
                                                  fg='#ffffff',
-                                                 font=('Consolas', 9))
+                                                 font=self.fonts['log'],
+                                                 state='disabled')
         self.log_text.pack(fill='both', expand=True, padx=5, pady=5)
         
         # Add initial log message
@@ -283,8 +556,8 @@ class PhoenixTkinterDashboard:
             self.connection_status.set("Connecting...")
             self.connect_button.config(state='disabled')
             
-            # Create async task for broker connection
-            threading.Thread(target=self._async_connect_broker, daemon=True).start()
+            # Broker I/O runs on the engine loop, next to the engine that reads the scanner
+            self._submit(self._async_connect_broker())
                 
         except Exception as e:
             self.log_message(f"❌ Error connecting to broker: {e}")
@@ -297,8 +570,8 @@ class PhoenixTkinterDashboard:
             self.connection_status.set("Disconnecting...")
             self.disconnect_button.config(state='disabled')
             
-            # Create async task for broker disconnection
-            threading.Thread(target=self._async_disconnect_broker, daemon=True).start()
+            # Broker I/O runs on the engine loop, next to the engine that reads the scanner
+            self._submit(self._async_disconnect_broker())
                 
         except Exception as e:
             self.log_message(f"❌ Error disconnecting from broker: {e}")
@@ -317,9 +590,11 @@ class PhoenixTkinterDashboard:
             
             # Create async task for starting trading
             if self.arbitrage_engine:
-                threading.Thread(target=self._async_start_trading, daemon=True).start()
+                self._submit(self._async_start_trading())
+                self._trading_running = True
                 self.trading_status.set("Starting...")
                 self.start_button.config(state='disabled')
+                self._wake_tick()
             else:
                 self.log_message("❌ Trading engine not available")
                 
@@ -333,7 +608,8 @@ class PhoenixTkinterDashboard:
             
             # Create async task for stopping trading
             if self.arbitrage_engine:
-                threading.Thread(target=self._async_stop_trading, daemon=True).start()
+                self._submit(self._async_stop_trading())
+                self._trading_running = False
                 self.trading_status.set("Stopping...")
                 self.stop_button.config(state='disabled')
             else:
@@ -345,79 +621,98 @@ class PhoenixTkinterDashboard:
     def _refresh_data(self):
         """Refresh all data displays"""
         self.log_message("🔄 Refreshing data...")
-        self._update_status()
-        self._update_opportunities()
-        self._update_positions()
+        self._request_snapshot(_ALL_CHANGES)
+    
+    def _submit(self, coro) -> concurrent.futures.Future:
+        """Run a coroutine on the background engine loop"""
+        return asyncio.run_coroutine_threadsafe(coro, self._engine_loop)
+    
+    def _call_in_gui(self, fn, *args, **kwargs):
+        """Apply a widget update on the Tk thread (safe from any thread)"""
+        self._gui_queue.put((fn, args, kwargs))
+        self._wake_gui()
+    
+    def _wake_gui(self):
+        """Signal the Tk thread that posted work is waiting"""
+        if self._wakeup_pending or self.root is None:
+            return
+        
+        self._wakeup_pending = True
+        try:
+            self.root.event_generate('<<GuiQueue>>', when='tail')
+        except (tk.TclError, RuntimeError):
+            # Window destroyed or mainloop gone; nothing left to update
+            self._wakeup_pending = False
     
-    def _async_connect_broker(self):
-        """Async wrapper for connecting to broker"""
+    def _on_gui_queue(self, event):
+        """Apply posted widget updates and queued log lines"""
+        self._wakeup_pending = False
+        for _ in range(_GUI_DRAIN_BATCH):
+            try:
+                fn, args, kwargs = self._gui_queue.get_nowait()
+            except queue.Empty:
+                break
+            # One failing update must not drop the rest of the batch
+            try:
+                fn(*args, **kwargs)
+            except Exception as e:
+                self.log_message(f"❌ GUI update failed: {e}")
+        else:
+            # Batch limit reached; continue after pending input is handled
+            self._wake_gui()
+        
+        self._flush_log()
+    
+    async def _async_connect_broker(self):
+        """Connect to broker (runs on the engine loop)"""
         try:
             # Check if pair_scanner exists and try to connect
-            if hasattr(self, 'pair_scanner') and self.pair_scanner:
+            if self.pair_scanner:
                 self.log_message("📡 Initializing broker connection...")
                 
-                # Run async broker connection in sync context
-                import asyncio
-                
-                # Create event loop for this thread if none exists
-                try:
-                    loop = asyncio.get_event_loop()
-                except RuntimeError:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                
                 # Try to connect to broker
                 try:
-                    loop.run_until_complete(self.pair_scanner.initialize())
+                    await self.pair_scanner.initialize()
                     
                     if self.pair_scanner.is_connected:
                         self.log_message("✅ Broker connected successfully")
                         self.log_message(f"📊 Connected to {self.pair_scanner.broker_type.value}")
                         
-                        # Get available pairs
-                        pairs = self.pair_scanner.get_available_pairs()
-                        self.log_message(f"💱 Found {len(pairs)} currency pairs")
+                        # Pairs were already loaded by initialize(); just count them
+                        self.log_message(f"💱 Found {len(self.pair_scanner.available_pairs)} currency pairs")
                         
-                        self.connection_status.set("Connected")
+                        self._call_in_gui(self.connection_status.set, "Connected")
                     else:
                         self.log_message("❌ Broker connection failed")
-                        self.connection_status.set("Disconnected")
+                        self._call_in_gui(self.connection_status.set, "Disconnected")
                         
                 except Exception as broker_error:
                     self.log_message(f"❌ Broker connection error: {broker_error}")
-                    self.connection_status.set("Disconnected")
+                    self._call_in_gui(self.connection_status.set, "Disconnected")
                     
             else:
                 self.log_message("❌ No broker scanner available")
-                self.connection_status.set("Disconnected")
+                self._call_in_gui(self.connection_status.set, "Disconnected")
             
-            self.connect_button.config(state='normal')
-            self.disconnect_button.config(state='normal')
+            self._call_in_gui(self.connect_button.config, state='normal')
+            self._call_in_gui(self.disconnect_button.config, state='normal')
             
         except Exception as e:
             self.log_message(f"❌ Failed to connect to broker: {e}")
-            self.connection_status.set("Disconnected")
-            self.connect_button.config(state='normal')
+            self._call_in_gui(self.connection_status.set, "Disconnected")
+            self._call_in_gui(self.connect_button.config, state='normal')
     
-    def _async_disconnect_broker(self):
-        """Async wrapper for disconnecting from broker"""
+    async def _async_disconnect_broker(self):
+        """Disconnect from broker (runs on the engine loop)"""
         try:
             # Check if pair_scanner exists and disconnect
-            if hasattr(self, 'pair_scanner') and self.pair_scanner:
+            if self.pair_scanner:
                 self.log_message("🔌 Disconnecting from broker...")
                 
-                # Run async broker disconnection
-                import asyncio
-                try:
-                    loop = asyncio.get_event_loop()
-                except RuntimeError:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                
                 try:
                     # Stop pair scanner if it has a stop method
                     if hasattr(self.pair_scanner, 'stop'):
-                        loop.run_until_complete(self.pair_scanner.stop())
+                        await self.pair_scanner.stop()
                     
                     # Reset connection status
                     self.pair_scanner.is_connected = False
@@ -426,76 +721,72 @@ class PhoenixTkinterDashboard:
                     self.log_message(f"⚠️ Disconnect warning: {disconnect_error}")
             
             self.log_message("✅ Broker disconnected")
-            self.connection_status.set("Disconnected")
-            self.connect_button.config(state='normal')
-            self.disconnect_button.config(state='normal')
-            
-            # Also stop trading if running
-            if self.trading_status and self.trading_status.get() == "Running":
-                self.log_message("🛑 Stopping trading due to disconnection...")
-                self.trading_status.set("Stopped")
+            self._call_in_gui(self._on_broker_disconnected)
             
         except Exception as e:
             self.log_message(f"❌ Failed to disconnect from broker: {e}")
-            self.disconnect_button.config(state='normal')
+            self._call_in_gui(self.disconnect_button.config, state='normal')
+    
+    def _on_broker_disconnected(self):
+        """Show the disconnection and stop trading if it is running (Tk thread)"""
+        self.connection_status.set("Disconnected")
+        self.connect_button.config(state='normal')
+        self.disconnect_button.config(state='normal')
+        
+        # Also stop trading if running
+        if self._trading_running:
+            self.log_message("🛑 Stopping trading due to disconnection...")
+            self._trading_running = False
+            self._submit(self._async_stop_trading())
 
-    def _async_start_trading(self):
-        """Async wrapper for starting trading"""
+    async def _async_start_trading(self):
+        """Start trading (runs on the engine loop)"""
         try:
             # Check if arbitrage_engine exists and start trading
-            if hasattr(self, 'arbitrage_engine') and self.arbitrage_engine:
+            if self.arbitrage_engine:
                 self.log_message("🚀 Starting arbitrage engine...")
                 
-                # Run async trading startup
-                import asyncio
-                try:
-                    loop = asyncio.get_event_loop()
-                except RuntimeError:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
+                # engine.start() runs the scan loop until the engine stops, so
+                # show it running before awaiting it
+                self.log_message("✅ Trading system started")
+                self.log_message("🔍 Scanning for arbitrage opportunities...")
+                self._call_in_gui(self.trading_status.set, "Running")
+                self._call_in_gui(self.stop_button.config, state='normal')
                 
                 try:
-                    # Start the arbitrage engine
-                    loop.run_until_complete(self.arbitrage_engine.start())
+                    await self.arbitrage_engine.start()
                     
-                    self.log_message("✅ Trading system started")
-                    self.log_message("🔍 Scanning for arbitrage opportunities...")
-                    self.trading_status.set("Running")
+                    self.log_message("🛑 Arbitrage engine stopped")
                     
                 except Exception as trading_error:
                     self.log_message(f"❌ Trading startup error: {trading_error}")
-                    self.trading_status.set("Stopped")
                     
             else:
                 self.log_message("❌ No arbitrage engine available")
-                self.trading_status.set("Stopped")
-            
-            self.start_button.config(state='normal')
-            self.stop_button.config(state='normal')
             
         except Exception as e:
             self.log_message(f"❌ Failed to start trading: {e}")
-            self.trading_status.set("Stopped")
-            self.start_button.config(state='normal')
+        finally:
+            # The engine has stopped or failed by now
+            self._call_in_gui(self._mark_trading_stopped)
+    
+    def _mark_trading_stopped(self):
+        """Show that the engine is no longer running (Tk thread)"""
+        self._trading_running = False
+        self.trading_status.set("Stopped")
+        self.start_button.config(state='normal')
+        self.stop_button.config(state='normal')
     
-    def _async_stop_trading(self):
-        """Async wrapper for stopping trading"""
+    async def _async_stop_trading(self):
+        """Stop trading (runs on the engine loop)"""
         try:
             # Check if arbitrage_engine exists and stop trading
-            if hasattr(self, 'arbitrage_engine') and self.arbitrage_engine:
+            if self.arbitrage_engine:
                 self.log_message("🛑 Stopping arbitrage engine...")
                 
-                # Run async trading shutdown
-                import asyncio
-                try:
-                    loop = asyncio.get_event_loop()
-                except RuntimeError:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                
                 try:
                     # Stop the arbitrage engine
-                    loop.run_until_complete(self.arbitrage_engine.stop())
+                    await self.arbitrage_engine.stop()
                     
                     self.log_message("✅ Trading system stopped")
                     
@@ -505,26 +796,45 @@ class PhoenixTkinterDashboard:
             else:
                 self.log_message("✅ Trading system stopped")
             
-            self.trading_status.set("Stopped")
-            self.start_button.config(state='normal')
-            self.stop_button.config(state='normal')
+            self._call_in_gui(self.trading_status.set, "Stopped")
+            self._call_in_gui(self.start_button.config, state='normal')
+            self._call_in_gui(self.stop_button.config, state='normal')
             
         except Exception as e:
             self.log_message(f"❌ Failed to stop trading: {e}")
-            self.stop_button.config(state='normal')
+            self._call_in_gui(self.stop_button.config, state='normal')
     
     def _update_status(self):
         """Update status information"""
         try:
-            if self.arbitrage_engine:
-                status = self.arbitrage_engine.get_status()
+            status = self._snapshot.get('status')
+            if status is not None:
+                counters = (
+                    status.get('status'),
+                    status.get('opportunities_found'),
+                    status.get('opportunities_executed'),
+                    status.get('success_rate'),
+                    status.get('active_positions'),
+                    status.get('total_profit')
+                )
+                if counters == self._status_snapshot:
+                    return
+                self._status_snapshot = counters
                 
-                self.trading_status.set(status.get('status', 'Unknown'))
-                self.opportunities_found.set(str(status.get('opportunities_found', 0)))
-                self.opportunities_executed.set(str(status.get('opportunities_executed', 0)))
-                self.success_rate.set(f"{status.get('success_rate', 0):.1f}%")
-                self.active_positions.set(str(status.get('active_positions', 0)))
-                self.total_profit.set(f"${status.get('total_profit', 0):.2f}")
+                texts = (
+                    ('status', self.trading_status, status.get('status', 'Unknown')),
+                    ('found', self.opportunities_found, str(status.get('opportunities_found', 0))),
+                    ('executed', self.opportunities_executed, str(status.get('opportunities_executed', 0))),
+                    ('success_rate', self.success_rate, _FMT_RATE(status.get('success_rate', 0))),
+                    ('positions', self.active_positions, str(status.get('active_positions', 0))),
+                    ('profit', self.total_profit, _FMT_USD(status.get('total_profit', 0)))
+                )
+                
+                # Only fields whose text changed fire their Tcl traces
+                for key, var, text in texts:
+                    if self._last_status.get(key) != text:
+                        self._last_status[key] = text
+                        var.set(text)
                 
         except Exception as e:
             self.log_message(f"❌ Error updating status: {e}")
@@ -532,23 +842,12 @@ class PhoenixTkinterDashboard:
     def _update_opportunities(self):
         """Update opportunities display"""
         try:
-            # Clear existing items
-            for item in self.opp_tree.get_children():
-                self.opp_tree.delete(item)
+            rows = []
+            for opp in self._snapshot.get('opportunities', ()):
+                key = (opp.pair1, opp.pair2, opp.pair3, opp.direction)
+                rows.append((key, opp))
             
-            if self.arbitrage_engine:
-                opportunities = self.arbitrage_engine.get_opportunities()
-                
-                for opp in opportunities[:10]:  # Show top 10
-                    triangle = f"{opp.pair1}-{opp.pair2}-{opp.pair3}"
-                    values = (
-                        triangle,
-                        f"{opp.profit_pips:.1f}",
-                        f"{opp.spread_cost:.1f}",
-                        f"{opp.net_profit:.1f}",
-                        f"{opp.confidence:.1%}"
-                    )
-                    self.opp_tree.insert('', 'end', values=values)
+            self.opp_rows.sync(rows)
                     
         except Exception as e:
             self.log_message(f"❌ Error updating opportunities: {e}")
@@ -556,55 +855,178 @@ class PhoenixTkinterDashboard:
     def _update_positions(self):
         """Update positions display"""
         try:
-            # Clear existing items
-            for item in self.pos_tree.get_children():
-                self.pos_tree.delete(item)
+            positions = self._snapshot.get('positions', ())
+            rows = [((pos.symbol, pos.ticket), pos) for pos in positions]
             
-            if self.arbitrage_engine:
-                positions = self.arbitrage_engine.get_positions()
-                
-                for pos in positions:
-                    values = (
-                        pos.symbol,
-                        pos.type,
-                        f"{pos.volume:.2f}",
-                        f"{pos.open_price:.5f}",
-                        f"{pos.current_price:.5f}",
-                        f"${pos.profit:.2f}"
-                    )
-                    self.pos_tree.insert('', 'end', values=values)
+            self.pos_rows.sync(rows)
                     
         except Exception as e:
             self.log_message(f"❌ Error updating positions: {e}")
     
     def log_message(self, message: str):
-        """Add message to log display"""
+        """Queue message for the log display (safe from any thread)"""
         timestamp = datetime.now().strftime("%H:%M:%S")
-        log_entry = f"[{timestamp}] {message}\n"
+        self._log_queue.append(f"[{timestamp}] {message}\n")
+        self._wake_gui()
+    
+    def _flush_log(self):
+        """Write queued log lines to the log display"""
+        if not self._log_queue:
+            return
+        
+        # One insert and one scroll for the whole batch
+        lines = []
+        while self._log_queue:
+            lines.append(self._log_queue.popleft())
         
-        self.log_text.insert('end', log_entry)
-        self.log_text.see('end')
+        # Follow new lines only while the user has not scrolled up
+        autoscroll = self.log_text.yview()[1] >= 1.0
         
-        # Limit log size
-        lines = self.log_text.get('1.0', 'end').split('\n')
-        if len(lines) > 100:
-            self.log_text.delete('1.0', '10.0')
+        self.log_text.configure(state='normal')
+        self.log_text.insert('end', ''.join(lines))
+        self._log_lines += len(lines)
+        
+        # Limit log size, counting lines instead of asking the widget
+        excess = self._log_lines - _MAX_LOG_LINES
+        if excess > 0:
+            self.log_text.delete('1.0', f'{excess + 1}.0')
+            self._log_lines -= excess
+        self.log_text.configure(state='disabled')
+        if autoscroll:
+            self.log_text.see('end')
     
     def start_update_loop(self):
         """Start the data update loop"""
-        def update_loop():
-            while self.is_running:
-                try:
-                    self.root.after(0, self._update_status)
-                    self.root.after(0, self._update_opportunities) 
-                    self.root.after(0, self._update_positions)
-                    time.sleep(2)  # Update every 2 seconds
-                except:
-                    break
-        
         self.is_running = True
-        self.update_thread = threading.Thread(target=update_loop, daemon=True)
-        self.update_thread.start()
+        self._after_id = self.root.after(self._target_ms, self._tick)
+    
+    def _tick(self):
+        """Refresh all displays and reschedule on the Tk main thread"""
+        self._after_id = None
+        if not self.is_running:
+            return
+        
+        # Skip while hidden
+        if not self._visible:
+            self._after_id = self.root.after(self._target_ms, self._tick)
+            return
+        
+        changes = set()
+        while True:
+            try:
+                changes.add(self._change_queue.get_nowait())
+            except queue.Empty:
+                break
+        
+        # Periodic full resync in case a change went unreported
+        now = time.monotonic()
+        if now - self._last_resync >= _RESYNC_SECONDS:
+            self._last_resync = now
+            changes.update(_ALL_CHANGES)
+        
+        if changes:
+            self._request_snapshot(changes)
+        
+        # _tick_ewma_ms tracks the render cost measured in _render
+        interval = max(self._target_ms, int(self._tick_ewma_ms * 1.2))
+        
+        # Nothing changes while the engine is stopped; poll rarely
+        if not (self.arbitrage_engine and self.arbitrage_engine.is_running):
+            interval = max(interval, _IDLE_INTERVAL_MS)
+        self._after_id = self.root.after(interval, self._tick)
+    
+    def _wake_tick(self):
+        """Run the next tick soon instead of waiting out an idle interval"""
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = self.root.after(self._target_ms, self._tick)
+    
+    def set_max_redraw_rate(self, hz: float):
+        """Set the maximum number of renders per second"""
+        self._min_render_interval = 1.0 / hz
+    
+    def _request_snapshot(self, changes):
+        """Ask the engine thread for fresh data; the render follows when it is ready"""
+        if self.arbitrage_engine:
+            self._engine_loop.call_soon_threadsafe(self._fetch_engine_state, frozenset(changes))
+    
+    def _fetch_engine_state(self, changes):
+        """Copy engine state into the snapshot (runs on the engine loop)"""
+        try:
+            engine = self.arbitrage_engine
+            fetched = {'status': engine.get_status()}
+            if 'opportunities' in changes:
+                fetched['opportunities'] = engine.get_opportunities()[:10]  # Show top 10
+            if 'positions' in changes:
+                fetched['positions'] = engine.get_positions()
+            
+            with self._snapshot_lock:
+                self._snapshot = {**self._snapshot, **fetched}
+            self._call_in_gui(self._render, changes)
+        
+        except Exception as e:
+            self.log_message(f"❌ Error fetching engine state: {e}")
+    
+    def _render(self, changes):
+        """Update the displays named in changes within one Tk callback
+        
+        Tk redraws at idle time, so everything updated here is laid out and
+        painted once. Renders closer together than _min_render_interval are
+        merged into one deferred render.
+        """
+        self._pending_changes.update(changes)
+        if not self._pending_changes:
+            return
+        
+        wait = self._min_render_interval - (time.monotonic() - self._last_render)
+        # A render already in flight (nested event loop) defers this one
+        if wait > 0 or self._rendering:
+            if self._render_after_id is None:
+                delay_ms = max(int(wait * 1000) + 1, _MIN_DEFER_MS)
+                self._render_after_id = self.root.after(delay_ms, self._render_deferred)
+            return
+        
+        start = time.perf_counter()
+        self._rendering = True
+        try:
+            changes = self._pending_changes
+            self._pending_changes = set()
+            self._last_render = time.monotonic()
+            
+            self._update_status()
+            if 'opportunities' in changes:
+                self._update_opportunities()
+            if 'positions' in changes:
+                self._update_positions()
+        finally:
+            self._rendering = False
+        
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self._tick_ewma_ms += _TICK_EWMA_ALPHA * (elapsed_ms - self._tick_ewma_ms)
+    
+    def _render_deferred(self):
+        """Run a render that was held back by the redraw rate ceiling"""
+        self._render_after_id = None
+        self._render(())
+    
+    def _on_map(self, event):
+        """Window shown again"""
+        # Child widgets inherit the root's bindings, only react to the window itself
+        if event.widget is self.root:
+            self._mapped = True
+            self._visible = not self._obscured
+    
+    def _on_unmap(self, event):
+        """Window iconified or withdrawn"""
+        if event.widget is self.root:
+            self._mapped = False
+            self._visible = False
+    
+    def _on_visibility(self, event):
+        """Window covered or uncovered by other windows"""
+        if event.widget is self.root:
+            self._obscured = event.state == 'VisibilityFullyObscured'
+            self._visible = self._mapped and not self._obscured
     
     async def start(self):
         """Start the dashboard"""
@@ -616,8 +1038,20 @@ class PhoenixTkinterDashboard:
         """Stop the dashboard"""
         self.is_running = False
         if self.root:
-            self.root.quit()
-            self.root.destroy()
+            if self._after_id is not None:
+                self.root.after_cancel(self._after_id)
+                self._after_id = None
+            if self._render_after_id is not None:
+                self.root.after_cancel(self._render_after_id)
+                self._render_after_id = None
+            for rows in (self.opp_rows, self.pos_rows):
+                if rows is not None:
+                    rows.cancel()
+            if self._engine_loop is not None:
+                self._engine_loop.call_soon_threadsafe(self._engine_loop.stop)
+            root, self.root = self.root, None
+            root.quit()
+            root.destroy()
     
     def run(self):
         """Run the GUI main loop"""
@@ -6,11 +6,92 @@ Centralized configuration management for the Phoenix system
 """
 
 import yaml
+import copy
 import os
 from pathlib import Path
 from typing import Dict, Any, Optional
 import logging
 
+# libyaml C bindings are much faster; fall back to the pure-Python ones
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+
+# Default configuration, written when no config file exists
+_DEFAULT_CONFIG: Dict[str, Any] = {
+    'broker': {
+        'name': 'IC_Markets',
+        'api_type': 'MT5',
+        'server': 'ICMarkets-Demo',
+        'login': 'your_login_here',
+        'password': 'your_password_here',
+        'timeout': 30,
+        'retries': 3,
+        'auto_connect': True,
+        'reconnect_interval': 60
+    },
+    'trading': {
+        'min_arbitrage_profit': 5,
+        'max_spread_cost': 8,
+        'min_liquidity': 1.0,
+        'base_lot_size': 0.01,
+        'max_position_risk': 2.0,
+        'max_total_exposure': 20.0,
+        'auto_start': False,
+        'profit_levels': {
+            'quick_scalp': 8,
+            'partial_1': 15,
+            'partial_2': 25,
+            'final_target': 40
+        }
+    },
+    'recovery': {
+        'max_recovery_layers': 6,
+        'recovery_multiplier': 1.5,
+        'strong_correlation': 0.8,
+        'medium_correlation': 0.6,
+        'weak_correlation': 0.4,
+        'recovery_delay': 30,
+        'max_recovery_time': 14400
+    },
+    'gui': {
+        'window_title': '🔥 Arbi Phoenix Dashboard',
+        'window_width': 1400,
+        'window_height': 900,
+        'portfolio_update': 1000,
+        'triangle_update': 500,
+        'recovery_update': 2000,
+        'theme': 'dark'
+    },
+    'logging': {
+        'level': 'INFO',
+        'file_path': 'data/logs/phoenix.log',
+        'max_file_size': '10MB',
+        'backup_count': 5
+    },
+    'risk_management': {
+        'max_daily_loss': 10.0,
+        'max_drawdown': 20.0,
+        'volatility_circuit': 95,
+        'correlation_circuit': 0.2,
+        'max_positions_per_pair': 3,
+        'max_total_positions': 50
+    }
+}
+
+def _deep_merge(defaults: Dict[str, Any], overrides: Dict[str, Any]) -> Dict[str, Any]:
+    """Overlay loaded values onto a copy of the defaults; empty (None) values keep the default"""
+    merged = {key: copy.deepcopy(value) for key, value in defaults.items() if key not in overrides}
+    for key, value in overrides.items():
+        default = defaults.get(key)
+        if isinstance(value, dict) and isinstance(default, dict):
+            value = _deep_merge(default, value)
+        elif value is None and default is not None:
+            value = copy.deepcopy(default)
+        merged[key] = value
+    return merged
+
 class ConfigManager:
     """
     🔥 Phoenix Configuration Manager
@@ -22,23 +103,73 @@ class ConfigManager:
         self.config_path = Path(config_path)
         self.logger = logging.getLogger("ConfigManager")
         self._config_data: Dict[str, Any] = {}
-        self._load_config()
+        
+        # Every dotted key path (leaves and subtrees) -> value, rebuilt on change
+        self._flat: Dict[str, Any] = {}
+        
+        # The YAML file is parsed on first access, not at construction
+        self._loaded = False
+        
+        # File mtime the in-memory config matches; None after set() or a failed load
+        self._mtime_ns: Optional[int] = None
+    
+    def _ensure_loaded(self):
+        """Load the configuration if nothing has been read yet"""
+        if not self._loaded:
+            self._load_config()
     
     def _load_config(self):
         """Load configuration from YAML file"""
         try:
             if not self.config_path.exists():
-                self.logger.warning(f"⚠️ Config file not found: {self.config_path}")
+                self.logger.warning("⚠️ Config file not found: %s", self.config_path)
                 self._create_default_config()
             
             with open(self.config_path, 'r', encoding='utf-8') as file:
-                self._config_data = yaml.safe_load(file) or {}
+                loaded = yaml.load(file, Loader=_Loader) or {}
+                self._mtime_ns = os.fstat(file.fileno()).st_mtime_ns
+            
+            if not isinstance(loaded, dict):
+                raise ValueError("top level of the config must be a mapping")
             
-            self.logger.info(f"✅ Configuration loaded from {self.config_path}")
+            # Fill in defaults once so every known key is present
+            self._config_data = _deep_merge(_DEFAULT_CONFIG, loaded)
+            
+            self.logger.info("✅ Configuration loaded from %s", self.config_path)
             
         except Exception as e:
-            self.logger.error(f"❌ Failed to load config: {e}")
+            self.logger.error("❌ Failed to load config: %s", e)
             self._config_data = self._get_default_config()
+            self._mtime_ns = None
+        
+        self._rebuild_flat()
+        self._loaded = True
+    
+    def _rebuild_flat(self):
+        """Index every dotted key path of the nested config"""
+        self._flat = {}
+        self._flatten('', self._config_data)
+        
+        # Sections read by the properties
+        self._broker = self._section('broker')
+        self._trading = self._section('trading')
+        self._recovery = self._section('recovery')
+        self._gui = self._section('gui')
+        self._profit = self._section('trading.profit_levels')
+        self._risk = self._section('risk_management')
+    
+    def _section(self, key_path: str) -> Dict[str, Any]:
+        """Config section at key_path, empty when missing or not a mapping"""
+        value = self._flat.get(key_path)
+        return value if isinstance(value, dict) else {}
+    
+    def _flatten(self, prefix: str, data: Dict[str, Any]):
+        """Add the entries of one (sub)tree under prefix"""
+        for key, value in data.items():
+            key_path = f"{prefix}{key}"
+            self._flat[key_path] = value
+            if isinstance(value, dict):
+                self._flatten(f"{key_path}.", value)
     
     def _create_default_config(self):
         """Create default configuration file"""
@@ -47,76 +178,17 @@ class ConfigManager:
             default_config = self._get_default_config()
             
             with open(self.config_path, 'w', encoding='utf-8') as file:
-                yaml.dump(default_config, file, default_flow_style=False, indent=2)
+                yaml.dump(default_config, file, Dumper=_Dumper, default_flow_style=False, indent=2)
             
-            self.logger.info(f"📝 Created default config at {self.config_path}")
+            self.logger.info("📝 Created default config at %s", self.config_path)
             self._config_data = default_config
             
         except Exception as e:
-            self.logger.error(f"❌ Failed to create default config: {e}")
+            self.logger.error("❌ Failed to create default config: %s", e)
     
     def _get_default_config(self) -> Dict[str, Any]:
-        """Get default configuration"""
-        return {
-            'broker': {
-                'name': 'IC_Markets',
-                'api_type': 'MT5',
-                'server': 'ICMarkets-Demo',
-                'login': 'your_login_here',
-                'password': 'your_password_here',
-                'timeout': 30,
-                'retries': 3,
-                'auto_connect': True,
-                'reconnect_interval': 60
-            },
-            'trading': {
-                'min_arbitrage_profit': 5,
-                'max_spread_cost': 8,
-                'min_liquidity': 1.0,
-                'base_lot_size': 0.01,
-                'max_position_risk': 2.0,
-                'max_total_exposure': 20.0,
-                'auto_start': False,
-                'profit_levels': {
-                    'quick_scalp': 8,
-                    'partial_1': 15,
-                    'partial_2': 25,
-                    'final_target': 40
-                }
-            },
-            'recovery': {
-                'max_recovery_layers': 6,
-                'recovery_multiplier': 1.5,
-                'strong_correlation': 0.8,
-                'medium_correlation': 0.6,
-                'weak_correlation': 0.4,
-                'recovery_delay': 30,
-                'max_recovery_time': 14400
-            },
-            'gui': {
-                'window_title': '🔥 Arbi Phoenix Dashboard',
-                'window_width': 1400,
-                'window_height': 900,
-                'portfolio_update': 1000,
-                'triangle_update': 500,
-                'recovery_update': 2000,
-                'theme': 'dark'
-            },
-            'logging': {
-                'level': 'INFO',
-                'file_path': 'data/logs/phoenix.log',
-                'max_file_size': '10MB',
-                'backup_count': 5
-            },
-            'risk_management': {
-                'max_daily_loss': 10.0,
-                'max_drawdown': 20.0,
-                'volatility_circuit': 95,
-                'correlation_circuit': 0.2,
-                'max_positions_per_pair': 3,
-                'max_total_positions': 50
-            }
-        }
+        """Get a fresh copy of the default configuration"""
+        return copy.deepcopy(_DEFAULT_CONFIG)
     
     def get(self, key_path: str, default: Any = None) -> Any:
         """
@@ -129,17 +201,8 @@ class ConfigManager:
         Returns:
             Configuration value
         """
-        try:
-            keys = key_path.split('.')
-            value = self._config_data
-            
-            for key in keys:
-                value = value[key]
-            
-            return value
-            
-        except (KeyError, TypeError):
-            return default
+        self._ensure_loaded()
+        return self._flat.get(key_path, default)
     
     def set(self, key_path: str, value: Any):
         """
@@ -149,6 +212,7 @@ class ConfigManager:
             key_path: Configuration key path
             value: Value to set
         """
+        self._ensure_loaded()
         try:
             keys = key_path.split('.')
             config = self._config_data
@@ -161,69 +225,89 @@ class ConfigManager:
             
             # Set value
             config[keys[-1]] = value
+            self._rebuild_flat()
+            self._mtime_ns = None
             
-            self.logger.info(f"📝 Config updated: {key_path} = {value}")
+            self.logger.info("📝 Config updated: %s = %s", key_path, value)
             
         except Exception as e:
-            self.logger.error(f"❌ Failed to set config {key_path}: {e}")
+            self.logger.error("❌ Failed to set config %s: %s", key_path, e)
     
     def save(self):
         """Save current configuration to file"""
+        self._ensure_loaded()
         try:
             with open(self.config_path, 'w', encoding='utf-8') as file:
-                yaml.dump(self._config_data, file, default_flow_style=False, indent=2)
+                yaml.dump(self._config_data, file, Dumper=_Dumper, default_flow_style=False, indent=2)
+            self._mtime_ns = self.config_path.stat().st_mtime_ns
             
-            self.logger.info(f"💾 Configuration saved to {self.config_path}")
+            self.logger.info("💾 Configuration saved to %s", self.config_path)
             
         except Exception as e:
-            self.logger.error(f"❌ Failed to save config: {e}")
+            self.logger.error("❌ Failed to save config: %s", e)
     
     def reload(self):
         """Reload configuration from file"""
+        try:
+            mtime_ns = self.config_path.stat().st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        
+        if self._loaded and mtime_ns is not None and mtime_ns == self._mtime_ns:
+            self.logger.info("🔄 Configuration unchanged, skipping reload")
+            return
+        
         self._load_config()
         self.logger.info("🔄 Configuration reloaded")
     
     @property
     def broker_config(self) -> Dict[str, Any]:
         """Get broker configuration"""
-        return self.get('broker', {})
+        self._ensure_loaded()
+        return self._broker
     
     @property
     def trading_config(self) -> Dict[str, Any]:
         """Get trading configuration"""
-        return self.get('trading', {})
+        self._ensure_loaded()
+        return self._trading
     
     @property
     def recovery_config(self) -> Dict[str, Any]:
         """Get recovery configuration"""
-        return self.get('recovery', {})
+        self._ensure_loaded()
+        return self._recovery
     
     @property
     def gui_config(self) -> Dict[str, Any]:
         """Get GUI configuration"""
-        return self.get('gui', {})
+        self._ensure_loaded()
+        return self._gui
     
     @property
     def profit_config(self) -> Dict[str, Any]:
         """Get profit configuration"""
-        return self.get('trading.profit_levels', {})
+        self._ensure_loaded()
+        return self._profit
     
     @property
     def risk_config(self) -> Dict[str, Any]:
         """Get risk management configuration"""
-        return self.get('risk_management', {})
+        self._ensure_loaded()
+        return self._risk
     
     def get_all(self) -> Dict[str, Any]:
         """Get all configuration data"""
+        self._ensure_loaded()
         return self._config_data.copy()
     
     def is_auto_connect_enabled(self) -> bool:
         """Check if auto-connect is enabled"""
-        return self.get('broker.auto_connect', True)
+        return self.get('broker.auto_connect')
     
     def is_auto_start_enabled(self) -> bool:
         """Check if auto-start trading is enabled"""
-        return self.get('trading.auto_start', False)
+        return self.get('trading.auto_start')
     
     def update_broker_credentials(self, login: str, password: str, server: str):
         """Update broker credentials"""
@@ -241,5 +325,5 @@ class ConfigManager:
         self.save()
         
         new_state = not current
-        self.logger.info(f"🔄 Auto-start trading: {'ON' if new_state else 'OFF'}")
+        self.logger.info("🔄 Auto-start trading: %s", 'ON' if new_state else 'OFF')
         return new_state
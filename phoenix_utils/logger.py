@@ -9,6 +9,8 @@ import logging
 import logging.handlers
 from pathlib import Path
 from datetime import datetime
+import atexit
+import queue
 import sys
 import os
 
@@ -17,6 +19,12 @@ class PhoenixLogger:
     🔥 Phoenix Logger - Advanced logging system
     """
     
+    # Handlers shared by every named logger, created on first use
+    _shared_handlers = None
+    
+    # Background thread writing the log files; stopped (and flushed) at exit
+    _listener = None
+    
     def __init__(self, name: str = "ArbiPhoenix"):
         self.name = name
         self.logger = logging.getLogger(name)
@@ -24,26 +32,32 @@ class PhoenixLogger:
         
         # Prevent duplicate handlers
         if not self.logger.handlers:
-            self._setup_handlers()
+            for handler in self._setup_handlers():
+                self.logger.addHandler(handler)
     
-    def _setup_handlers(self):
-        """Setup logging handlers"""
+    @classmethod
+    def _setup_handlers(cls):
+        """Setup logging handlers once and return the shared ones"""
+        if cls._shared_handlers is not None:
+            return cls._shared_handlers
         
         # Create logs directory
         log_dir = Path("data/logs")
         log_dir.mkdir(parents=True, exist_ok=True)
+        today = datetime.now().strftime('%Y%m%d')
         
-        # Console handler with colors
+        # Console handler, colored only when writing to a terminal
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(logging.INFO)
-        console_formatter = ColoredFormatter(
+        formatter_class = ColoredFormatter if sys.stdout.isatty() else logging.Formatter
+        console_formatter = formatter_class(
             '%(asctime)s | %(levelname)8s | %(name)s | %(message)s',
             datefmt='%H:%M:%S'
         )
         console_handler.setFormatter(console_formatter)
         
         # File handler with rotation
-        log_file = log_dir / f"phoenix_{datetime.now().strftime('%Y%m%d')}.log"
+        log_file = log_dir / f"phoenix_{today}.log"
         file_handler = logging.handlers.RotatingFileHandler(
             log_file,
             maxBytes=10*1024*1024,  # 10MB
@@ -58,7 +72,7 @@ class PhoenixLogger:
         file_handler.setFormatter(file_formatter)
         
         # Error file handler
-        error_file = log_dir / f"phoenix_errors_{datetime.now().strftime('%Y%m%d')}.log"
+        error_file = log_dir / f"phoenix_errors_{today}.log"
         error_handler = logging.handlers.RotatingFileHandler(
             error_file,
             maxBytes=5*1024*1024,  # 5MB
@@ -68,10 +82,17 @@ class PhoenixLogger:
         error_handler.setLevel(logging.ERROR)
         error_handler.setFormatter(file_formatter)
         
-        # Add handlers
-        self.logger.addHandler(console_handler)
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(error_handler)
+        # File writes and rotation happen on a listener thread; logging calls only enqueue
+        log_queue = queue.Queue(-1)
+        listener = logging.handlers.QueueListener(
+            log_queue, file_handler, error_handler, respect_handler_level=True
+        )
+        listener.start()
+        atexit.register(listener.stop)
+        cls._listener = listener
+        
+        cls._shared_handlers = (console_handler, logging.handlers.QueueHandler(log_queue))
+        return cls._shared_handlers
     
     def get_logger(self):
         """Get the configured logger"""
@@ -90,13 +111,18 @@ class ColoredFormatter(logging.Formatter):
     }
     RESET = '\033[0m'
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._colored = {level: f"{color}{level}{self.RESET}" for level, color in self.COLORS.items()}
+    
     def format(self, record):
-        # Add color to level name
+        # Color the level name for this handler only; file handlers see the plain one
         levelname = record.levelname
-        if levelname in self.COLORS:
-            record.levelname = f"{self.COLORS[levelname]}{levelname}{self.RESET}"
-        
-        return super().format(record)
+        record.levelname = self._colored.get(levelname, levelname)
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
 
 def setup_logger(name: str = "ArbiPhoenix") -> logging.Logger:
     """
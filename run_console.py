@@ -16,13 +16,37 @@ import signal
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-from phoenix_core.arbitrage_engine import ArbitrageEngine
-from phoenix_core.recovery_system import RecoverySystem
-from phoenix_core.profit_harvester import ProfitHarvester
-from phoenix_brokers.pair_scanner import BrokerPairScanner
 from phoenix_utils.logger import setup_logger
 from phoenix_utils.config_manager import ConfigManager
 
+# Static console text, built once
+_SEPARATOR = "=" * 60
+_BANNER = """
+    🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥
+    🔥                                                                  🔥
+    🔥                     ARBI PHOENIX CONSOLE                        🔥
+    🔥                                                                  🔥
+    🔥              "From the ashes of loss, rises the                 🔥
+    🔥                      phoenix of profit"                         🔥
+    🔥                                                                  🔥
+    🔥                Console Mode - No GUI Required                   🔥
+    🔥                                                                  🔥
+    🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥
+    
+    ⚡ Features:
+    • Triangular Arbitrage Engine
+    • Multi-layer Recovery System  
+    • Intelligent Profit Harvesting
+    • Console-based Monitoring
+    • Auto-connection & Auto-trading
+    
+    🛡️ "The Phoenix Never Dies" 🛡️
+    
+    Commands:
+    • Ctrl+C: Stop trading and exit
+    • Status updates every 30 seconds
+    """
+
 class ArbiPhoenixConsole:
     """
     🔥 Console-only Arbi Phoenix System
@@ -52,6 +76,12 @@ class ArbiPhoenixConsole:
         try:
             self.logger.info("🚀 Initializing Phoenix components...")
             
+            # Imported here so start-up does not pay for modules until they are needed
+            from phoenix_brokers.pair_scanner import BrokerPairScanner
+            from phoenix_core.arbitrage_engine import ArbitrageEngine
+            from phoenix_core.recovery_system import RecoverySystem
+            from phoenix_core.profit_harvester import ProfitHarvester
+            
             # 1. Initialize broker pair scanner
             self.pair_scanner = BrokerPairScanner(self.config.broker_config)
             if self.config.is_auto_connect_enabled():
@@ -59,7 +89,7 @@ class ArbiPhoenixConsole:
                 try:
                     await self.pair_scanner.initialize()
                 except Exception as e:
-                    self.logger.warning(f"⚠️ Broker connection failed: {e}")
+                    self.logger.warning("⚠️ Broker connection failed: %s", e)
                     self.logger.info("📝 Continuing in demo mode...")
             else:
                 self.logger.info("🔗 Auto-connection disabled - running in demo mode")
@@ -86,7 +116,7 @@ class ArbiPhoenixConsole:
             self.logger.info("✅ Phoenix initialization complete - Ready to rise!")
             
         except Exception as e:
-            self.logger.error(f"❌ Phoenix initialization failed: {e}")
+            self.logger.error("❌ Phoenix initialization failed: %s", e)
             raise
     
     async def start_trading(self):
@@ -113,8 +143,14 @@ class ArbiPhoenixConsole:
             self.is_running = True
             
             if tasks:
-                # Run all components concurrently
-                await asyncio.gather(*tasks)
+                # Run all components concurrently; if one fails, cancel the rest
+                # (asyncio.TaskGroup needs Python 3.11, the README supports 3.9+)
+                tasks = [asyncio.ensure_future(task) for task in tasks]
+                try:
+                    await asyncio.gather(*tasks)
+                finally:
+                    for task in tasks:
+                        task.cancel()
             else:
                 # Just keep running in demo mode
                 await self.demo_mode()
@@ -123,7 +159,7 @@ class ArbiPhoenixConsole:
             self.logger.info("🛑 Phoenix shutdown requested by user")
             await self.stop()
         except Exception as e:
-            self.logger.error(f"💥 Phoenix encountered an error: {e}")
+            self.logger.error("💥 Phoenix encountered an error: %s", e)
             await self.stop()
     
     async def demo_mode(self):
@@ -139,9 +175,9 @@ class ArbiPhoenixConsole:
     
     def print_status(self):
         """Print current system status"""
-        print("\n" + "="*60)
+        print("\n" + _SEPARATOR)
         print("🔥 ARBI PHOENIX - STATUS REPORT")
-        print("="*60)
+        print(_SEPARATOR)
         
         # Connection status
         if self.pair_scanner:
@@ -169,7 +205,7 @@ class ArbiPhoenixConsole:
             print(f"💎 Profit Harvester: {prof_status['status']}")
             print(f"📊 Total Harvested: ${prof_status['total_harvested']:.2f}")
         
-        print("="*60)
+        print(_SEPARATOR)
     
     async def stop(self):
         """Stop the Phoenix system"""
@@ -207,32 +243,7 @@ class ArbiPhoenixConsole:
 
 def print_phoenix_banner():
     """Print the Phoenix startup banner"""
-    banner = """
-    🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥
-    🔥                                                                  🔥
-    🔥                     ARBI PHOENIX CONSOLE                        🔥
-    🔥                                                                  🔥
-    🔥              "From the ashes of loss, rises the                 🔥
-    🔥                      phoenix of profit"                         🔥
-    🔥                                                                  🔥
-    🔥                Console Mode - No GUI Required                   🔥
-    🔥                                                                  🔥
-    🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥
-    
-    ⚡ Features:
-    • Triangular Arbitrage Engine
-    • Multi-layer Recovery System  
-    • Intelligent Profit Harvesting
-    • Console-based Monitoring
-    • Auto-connection & Auto-trading
-    
-    🛡️ "The Phoenix Never Dies" 🛡️
-    
-    Commands:
-    • Ctrl+C: Stop trading and exit
-    • Status updates every 30 seconds
-    """
-    print(banner)
+    print(_BANNER)
 
 async def main():
     """Main entry point for console mode"""
@@ -241,13 +252,19 @@ async def main():
     # Create Phoenix console system
     phoenix = ArbiPhoenixConsole()
     
-    # Setup signal handlers
-    def signal_handler(signum, frame):
+    # Setup signal handlers; they run as ordinary loop callbacks
+    loop = asyncio.get_running_loop()
+    
+    def request_stop(signum):
         print(f"\n🔥 Received signal {signum} - Shutting down Phoenix...")
-        asyncio.create_task(phoenix.stop())
+        loop.create_task(phoenix.stop())
     
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(signum, request_stop, signum)
+        except NotImplementedError:
+            # Windows loops lack add_signal_handler; hand off from the signal frame instead
+            signal.signal(signum, lambda sig, frame: loop.call_soon_threadsafe(request_stop, sig))
     
     try:
         # Start the system
@@ -263,5 +280,10 @@ async def main():
             await phoenix.stop()
 
 if __name__ == "__main__":
-    # Run the Phoenix console
-    asyncio.run(main())
+    # Run the Phoenix console, on uvloop when it is installed (not available on Windows)
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
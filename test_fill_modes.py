@@ -8,17 +8,87 @@ Test script for order execution and fill modes across different brokers
 
 import sys
 import asyncio
+import functools
+import types
 from pathlib import Path
 
-# Add project root to Python path
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
+# Add project root to Python path (already there when run as a script)
+project_root = str(Path(__file__).resolve().parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 from phoenix_brokers.order_executor import (
-    BrokerOrderExecutor, OrderRequest, OrderType, FillMode, OrderStatus
+    BrokerOrderExecutor, OrderRequest, OrderResult, OrderType, FillMode, OrderStatus
 )
 from phoenix_utils.logger import setup_logger
 
+# Fill mode reference shown by show_fill_mode_comparison, built once
+_FILL_MODE_TABLE = tuple(
+    (mode, types.MappingProxyType(info)) for mode, info in {
+        'IOC': {
+            'name': 'Immediate or Cancel',
+            'description': 'Execute immediately, cancel unfilled portion',
+            'best_for': 'Fast arbitrage, partial fills OK',
+            'risk': 'Medium',
+            'speed': 'Very Fast'
+        },
+        'FOK': {
+            'name': 'Fill or Kill',
+            'description': 'Execute completely or cancel entirely',
+            'best_for': 'All-or-nothing strategies',
+            'risk': 'Low',
+            'speed': 'Very Fast'
+        },
+        'MARKET': {
+            'name': 'Market Execution',
+            'description': 'Execute at best available price',
+            'best_for': 'Guaranteed execution',
+            'risk': 'High (slippage)',
+            'speed': 'Fast'
+        },
+        'GTC': {
+            'name': 'Good Till Cancelled',
+            'description': 'Stay active until filled or cancelled',
+            'best_for': 'Limit orders, patient strategies',
+            'risk': 'Low',
+            'speed': 'Slow'
+        },
+        'INSTANT': {
+            'name': 'Instant Execution',
+            'description': 'Execute at quoted price or reject',
+            'best_for': 'Price-sensitive strategies',
+            'risk': 'Medium',
+            'speed': 'Very Fast'
+        }
+    }.items()
+)
+
+@functools.lru_cache(maxsize=32)
+def _executor(broker_type, config_items):
+    """Executor shared by every test using the same broker and config"""
+    return BrokerOrderExecutor(broker_type, dict(config_items))
+
+@functools.lru_cache(maxsize=64)
+def _capabilities(broker_type, config_items):
+    """Capabilities of the shared executor"""
+    return _executor(broker_type, config_items).get_broker_capabilities()
+
+class DryRunExecutor(BrokerOrderExecutor):
+    """Executor that validates orders instead of sending them to the broker"""
+    
+    async def execute_order(self, order_request: OrderRequest) -> OrderResult:
+        if self._validate_order_request(order_request):
+            return OrderResult(success=True, status=OrderStatus.FILLED, filled_volume=order_request.volume)
+        return OrderResult(success=False, status=OrderStatus.REJECTED, error_message="Invalid order request")
+
+def get_executor(broker_type, config):
+    """Get a cached executor for a broker and config dict"""
+    return _executor(broker_type, frozenset(config.items()))
+
+def get_capabilities(broker_type, config):
+    """Get cached broker capabilities for a broker and config dict"""
+    return _capabilities(broker_type, frozenset(config.items()))
+
 async def test_broker_capabilities():
     """Test broker capabilities and fill modes"""
     print("🔥 ARBI PHOENIX - FILL MODE TESTING")
@@ -36,37 +106,43 @@ async def test_broker_capabilities():
         ('FXCM', {'default_fill_mode': 'MARKET'})
     ]
     
-    for broker_type, config in brokers_to_test:
+    async def probe(broker_type, config):
+        """Collect one broker's capabilities and fill mode adjustments"""
+        executor = get_executor(broker_type, config)
+        capabilities = get_capabilities(broker_type, config)
+        test_modes = [FillMode.IOC, FillMode.FOK, FillMode.MARKET, FillMode.GTC]
+        adjustments = [(mode, executor._adjust_fill_mode(mode)) for mode in test_modes]
+        return capabilities, adjustments
+    
+    # Probe all brokers concurrently, then report in a fixed order
+    results = await asyncio.gather(
+        *(probe(broker_type, config) for broker_type, config in brokers_to_test),
+        return_exceptions=True
+    )
+    
+    for (broker_type, _), result in zip(brokers_to_test, results):
         print(f"\n🎯 Testing {broker_type}")
         print("-" * 40)
         
-        try:
-            # Create executor
-            executor = BrokerOrderExecutor(broker_type, config)
-            
-            # Get capabilities
-            capabilities = executor.get_broker_capabilities()
-            
-            print(f"✅ Broker Type: {capabilities['broker_type']}")
-            print(f"📊 Supported Fill Modes: {', '.join(capabilities['supported_fill_modes'])}")
-            print(f"🎯 Market Execution: {capabilities['market_execution']}")
-            print(f"⚡ Instant Execution: {capabilities['instant_execution']}")
-            print(f"📋 Request Execution: {capabilities['request_execution']}")
-            print(f"📏 Max Deviation: {capabilities['max_deviation']}")
-            print(f"📦 Min Volume: {capabilities['min_volume']}")
-            print(f"📈 Volume Step: {capabilities['volume_step']}")
-            
-            # Test fill mode adjustment
-            print(f"\n🔄 Fill Mode Adjustment Test:")
-            test_modes = [FillMode.IOC, FillMode.FOK, FillMode.MARKET, FillMode.GTC]
-            
-            for mode in test_modes:
-                adjusted = executor._adjust_fill_mode(mode)
-                status = "✅" if adjusted == mode else "🔄"
-                print(f"  {status} {mode.value} → {adjusted.value}")
-            
-        except Exception as e:
-            print(f"❌ Error testing {broker_type}: {e}")
+        if isinstance(result, Exception):
+            print(f"❌ Error testing {broker_type}: {result}")
+            continue
+        
+        capabilities, adjustments = result
+        print(f"✅ Broker Type: {capabilities['broker_type']}")
+        print(f"📊 Supported Fill Modes: {', '.join(capabilities['supported_fill_modes'])}")
+        print(f"🎯 Market Execution: {capabilities['market_execution']}")
+        print(f"⚡ Instant Execution: {capabilities['instant_execution']}")
+        print(f"📋 Request Execution: {capabilities['request_execution']}")
+        print(f"📏 Max Deviation: {capabilities['max_deviation']}")
+        print(f"📦 Min Volume: {capabilities['min_volume']}")
+        print(f"📈 Volume Step: {capabilities['volume_step']}")
+        
+        # Fill mode adjustment
+        print(f"\n🔄 Fill Mode Adjustment Test:")
+        for mode, adjusted in adjustments:
+            status = "✅" if adjusted == mode else "🔄"
+            print(f"  {status} {mode.value} → {adjusted.value}")
 
 async def test_order_creation():
     """Test order creation with different fill modes"""
@@ -74,7 +150,7 @@ async def test_order_creation():
     print("-" * 40)
     
     # Create MT5 executor for testing
-    executor = BrokerOrderExecutor('MT5', {'default_fill_mode': 'IOC'})
+    executor = get_executor('MT5', {'default_fill_mode': 'IOC'})
     
     # Test different order types and fill modes
     test_orders = [
@@ -132,7 +208,8 @@ async def test_triangle_execution_simulation():
     print(f"\n🔺 TRIANGLE ARBITRAGE SIMULATION")
     print("-" * 40)
     
-    executor = BrokerOrderExecutor('MT5', {
+    # Dry run: orders are validated, never sent
+    executor = DryRunExecutor('MT5', {
         'default_fill_mode': 'IOC',
         'max_deviation': 10,
         'execution_timeout': 5.0
@@ -143,27 +220,33 @@ async def test_triangle_execution_simulation():
     print("📊 Forward Direction: BUY EUR/USD, BUY GBP/USD, SELL EUR/GBP")
     
     try:
-        # Note: This won't actually execute since no connection is set
-        # It will test the order creation and validation logic
-        
         pairs = ['EURUSD', 'GBPUSD', 'EURGBP']
         volumes = [0.01, 0.01, 0.01]
         directions = ['buy', 'buy', 'sell']
         
-        print(f"\n📋 Triangle Orders:")
-        for i, (pair, volume, direction) in enumerate(zip(pairs, volumes, directions), 1):
-            order_type = OrderType.MARKET_BUY if direction == 'buy' else OrderType.MARKET_SELL
-            
-            order_request = OrderRequest(
+        # Build all three legs up front so they can be submitted as one batch
+        order_requests = [
+            OrderRequest(
                 symbol=pair,
-                order_type=order_type,
+                order_type=OrderType.MARKET_BUY if direction == 'buy' else OrderType.MARKET_SELL,
                 volume=volume,
                 fill_mode=FillMode.IOC,
                 comment=f"Phoenix Triangle {i}/3"
             )
-            
+            for i, (pair, volume, direction) in enumerate(zip(pairs, volumes, directions), 1)
+        ]
+        
+        print(f"\n📋 Triangle Orders:")
+        for i, (order_request, direction) in enumerate(zip(order_requests, directions), 1):
             is_valid = executor._validate_order_request(order_request)
-            print(f"  {i}. {direction.upper()} {pair} {volume} lots - {'✅' if is_valid else '❌'}")
+            print(f"  {i}. {direction.upper()} {order_request.symbol} {order_request.volume} lots - {'✅' if is_valid else '❌'}")
+        
+        # All legs are stamped with one shared send time
+        results = await executor.execute_batch(order_requests, placement_delay=0.1)
+        placement_times = {order.placement_time for order in order_requests}
+        assert len(placement_times) == 1, "Triangle legs have different placement times"
+        valid = sum(1 for result in results if result.success)
+        print(f"\n📤 Batch dry run: {valid}/{len(results)} legs valid, one shared placement time")
         
         print(f"\n⚡ Execution Mode: IOC (Immediate or Cancel)")
         print(f"🎯 Expected Behavior: All 3 orders execute simultaneously")
@@ -175,53 +258,18 @@ async def test_triangle_execution_simulation():
 
 async def show_fill_mode_comparison():
     """Show comparison of fill modes"""
-    print(f"\n📊 FILL MODE COMPARISON")
-    print("=" * 60)
-    
-    fill_modes = {
-        'IOC': {
-            'name': 'Immediate or Cancel',
-            'description': 'Execute immediately, cancel unfilled portion',
-            'best_for': 'Fast arbitrage, partial fills OK',
-            'risk': 'Medium',
-            'speed': 'Very Fast'
-        },
-        'FOK': {
-            'name': 'Fill or Kill',
-            'description': 'Execute completely or cancel entirely',
-            'best_for': 'All-or-nothing strategies',
-            'risk': 'Low',
-            'speed': 'Very Fast'
-        },
-        'MARKET': {
-            'name': 'Market Execution',
-            'description': 'Execute at best available price',
-            'best_for': 'Guaranteed execution',
-            'risk': 'High (slippage)',
-            'speed': 'Fast'
-        },
-        'GTC': {
-            'name': 'Good Till Cancelled',
-            'description': 'Stay active until filled or cancelled',
-            'best_for': 'Limit orders, patient strategies',
-            'risk': 'Low',
-            'speed': 'Slow'
-        },
-        'INSTANT': {
-            'name': 'Instant Execution',
-            'description': 'Execute at quoted price or reject',
-            'best_for': 'Price-sensitive strategies',
-            'risk': 'Medium',
-            'speed': 'Very Fast'
-        }
-    }
+    lines = ["\n📊 FILL MODE COMPARISON\n", "=" * 60 + "\n"]
+    for mode, info in _FILL_MODE_TABLE:
+        lines.append(
+            f"\n🎯 {mode} - {info['name']}\n"
+            f"   📝 {info['description']}\n"
+            f"   💡 Best for: {info['best_for']}\n"
+            f"   ⚠️ Risk: {info['risk']}\n"
+            f"   ⚡ Speed: {info['speed']}\n"
+        )
     
-    for mode, info in fill_modes.items():
-        print(f"\n🎯 {mode} - {info['name']}")
-        print(f"   📝 {info['description']}")
-        print(f"   💡 Best for: {info['best_for']}")
-        print(f"   ⚠️ Risk: {info['risk']}")
-        print(f"   ⚡ Speed: {info['speed']}")
+    # One write for the whole report
+    sys.stdout.write(''.join(lines))
 
 async def main():
     """Main test function"""
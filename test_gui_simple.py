@@ -7,113 +7,118 @@ Test tkinter GUI without complex dependencies
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
 import threading
-import time
+from collections import deque
+
+# Shared widget options
+_BG = '#2b2b2b'
+_CONN_BTN = {'fg': 'white', 'font': ('Arial', 10, 'bold')}
+_TRADE_BTN = {'fg': 'white', 'font': ('Arial', 11, 'bold')}
+_PANEL = {'bg': _BG, 'fg': '#ffffff', 'font': ('Arial', 12, 'bold')}
+_STATUS_ITEM = {'bg': _BG, 'fg': '#00ff00', 'font': ('Arial', 10)}
+
+_STATUS_ITEMS = (
+    "Account Balance: $10,000.00",
+    "Total Profit: $0.00",
+    "Opportunities Found: 0",
+    "Opportunities Executed: 0",
+    "Success Rate: 0.0%",
+    "Active Positions: 0"
+)
 
 class SimplePhoenixGUI:
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("🔥 Arbi Phoenix Dashboard")
         self.root.geometry("1000x700")
-        self.root.configure(bg='#2b2b2b')
+        self.root.configure(bg=_BG)
         
         # Status variables
         self.connection_status = tk.StringVar(value="Disconnected")
         self.trading_status = tk.StringVar(value="Stopped")
         
+        # Log lines and widget updates from any thread, applied by _poll_gui
+        self._log_buf = deque(maxlen=10_000)
+        self._gui_calls = deque()
+        
+        # Set to abort simulated operations still waiting; replaced after each use
+        self._cancel = threading.Event()
+        
         self.create_gui()
+        self.root.after(50, self._poll_gui)
     
     def create_gui(self):
         """Create the GUI"""
         # Header
-        header = tk.Frame(self.root, bg='#2b2b2b', height=80)
+        header = tk.Frame(self.root, bg=_BG, height=80)
         header.pack(fill='x', padx=10, pady=5)
         header.pack_propagate(False)
         
         title = tk.Label(header, text="🔥 ARBI PHOENIX DASHBOARD", 
-                        bg='#2b2b2b', fg='#ff6b35',
+                        bg=_BG, fg='#ff6b35',
                         font=('Arial', 16, 'bold'))
         title.pack(pady=10)
         
         subtitle = tk.Label(header, text="The Ultimate Immortal Forex Trading System",
-                           bg='#2b2b2b', fg='#ffffff',
+                           bg=_BG, fg='#ffffff',
                            font=('Arial', 10))
         subtitle.pack()
         
         # Control Panel
-        control_frame = tk.Frame(self.root, bg='#2b2b2b', height=100)
+        control_frame = tk.Frame(self.root, bg=_BG, height=100)
         control_frame.pack(fill='x', padx=10, pady=5)
         control_frame.pack_propagate(False)
         
         # Connection row
-        conn_frame = tk.Frame(control_frame, bg='#2b2b2b')
+        conn_frame = tk.Frame(control_frame, bg=_BG)
         conn_frame.pack(fill='x', pady=(5, 0))
         
         self.connect_btn = tk.Button(conn_frame, text="🔗 Connect Broker",
                                     command=self.connect_broker,
-                                    bg='#0066cc', fg='white',
-                                    font=('Arial', 10, 'bold'), width=18)
+                                    bg='#0066cc', width=18, **_CONN_BTN)
         self.connect_btn.pack(side='left', padx=5)
         
         self.disconnect_btn = tk.Button(conn_frame, text="❌ Disconnect",
                                        command=self.disconnect_broker,
-                                       bg='#666666', fg='white',
-                                       font=('Arial', 10, 'bold'), width=15)
+                                       bg='#666666', width=15, **_CONN_BTN)
         self.disconnect_btn.pack(side='left', padx=5)
         
         status_label = tk.Label(conn_frame, textvariable=self.connection_status,
-                               bg='#2b2b2b', fg='#ffff00',
+                               bg=_BG, fg='#ffff00',
                                font=('Arial', 10, 'bold'))
         status_label.pack(side='left', padx=20)
         
         # Trading row
-        trade_frame = tk.Frame(control_frame, bg='#2b2b2b')
+        trade_frame = tk.Frame(control_frame, bg=_BG)
         trade_frame.pack(fill='x', pady=(5, 5))
         
         self.start_btn = tk.Button(trade_frame, text="🚀 Start Trading",
                                   command=self.start_trading,
-                                  bg='#00aa00', fg='white',
-                                  font=('Arial', 11, 'bold'), width=15)
+                                  bg='#00aa00', width=15, **_TRADE_BTN)
         self.start_btn.pack(side='left', padx=5)
         
         self.stop_btn = tk.Button(trade_frame, text="🛑 Stop Trading",
                                  command=self.stop_trading,
-                                 bg='#aa0000', fg='white',
-                                 font=('Arial', 11, 'bold'), width=15)
+                                 bg='#aa0000', width=15, **_TRADE_BTN)
         self.stop_btn.pack(side='left', padx=5)
         
         trading_label = tk.Label(trade_frame, textvariable=self.trading_status,
-                                bg='#2b2b2b', fg='#00ff00',
+                                bg=_BG, fg='#00ff00',
                                 font=('Arial', 11, 'bold'))
         trading_label.pack(side='left', padx=20)
         
         # Status Panel
-        status_frame = tk.LabelFrame(self.root, text="📊 System Status",
-                                    bg='#2b2b2b', fg='#ffffff',
-                                    font=('Arial', 12, 'bold'))
+        status_frame = tk.LabelFrame(self.root, text="📊 System Status", **_PANEL)
         status_frame.pack(fill='x', padx=10, pady=5)
         
         # Status items
-        status_items = [
-            "Account Balance: $10,000.00",
-            "Total Profit: $0.00", 
-            "Opportunities Found: 0",
-            "Opportunities Executed: 0",
-            "Success Rate: 0.0%",
-            "Active Positions: 0"
-        ]
-        
-        for i, item in enumerate(status_items):
+        for i, item in enumerate(_STATUS_ITEMS):
             row = i // 3
             col = i % 3
-            label = tk.Label(status_frame, text=item,
-                           bg='#2b2b2b', fg='#00ff00',
-                           font=('Arial', 10))
+            label = tk.Label(status_frame, text=item, **_STATUS_ITEM)
             label.grid(row=row, column=col, sticky='w', padx=10, pady=5)
         
         # Log Panel
-        log_frame = tk.LabelFrame(self.root, text="📝 Activity Log",
-                                 bg='#2b2b2b', fg='#ffffff',
-                                 font=('Arial', 12, 'bold'))
+        log_frame = tk.LabelFrame(self.root, text="📝 Activity Log", **_PANEL)
         log_frame.pack(fill='both', expand=True, padx=10, pady=5)
         
         self.log_text = scrolledtext.ScrolledText(log_frame, height=15,
@@ -130,45 +135,85 @@ class SimplePhoenixGUI:
         """Add message to log"""
         import datetime
         timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        log_entry = f"[{timestamp}] {message}\n"
-        self.log_text.insert('end', log_entry)
-        self.log_text.see('end')
+        self._log_buf.append(f"[{timestamp}] {message}\n")
+    
+    def _call_in_gui(self, fn):
+        """Run fn on the Tk thread (safe from worker threads)"""
+        self._gui_calls.append(fn)
+    
+    def _cancel_pending(self):
+        """Abort simulated operations still waiting"""
+        self._cancel.set()
+        self._cancel = threading.Event()
+    
+    def _poll_gui(self):
+        """Apply posted widget updates, write buffered log lines, then poll again"""
+        while self._gui_calls:
+            self._gui_calls.popleft()()
+        
+        if self._log_buf:
+            lines = []
+            while self._log_buf:
+                lines.append(self._log_buf.popleft())
+            
+            # Follow new lines only while the user has not scrolled up
+            autoscroll = self.log_text.yview()[1] >= 1.0
+            self.log_text.insert('end', ''.join(lines))
+            if autoscroll:
+                self.log_text.see('end')
+        
+        self.root.after(50, self._poll_gui)
     
     def connect_broker(self):
         """Connect to broker"""
         self.log_message("🔗 Connecting to broker...")
         self.connection_status.set("Connecting...")
         self.connect_btn.config(state='disabled')
+        cancel = self._cancel
         
         def connect():
-            time.sleep(2)  # Simulate connection
-            self.log_message("✅ Broker connected successfully")
-            self.connection_status.set("Connected")
-            self.connect_btn.config(state='normal')
-            self.disconnect_btn.config(state='normal')
+            # Simulate connection; Disconnect aborts the wait
+            if not cancel.wait(2.0):
+                self._call_in_gui(self._on_connected)
         
         threading.Thread(target=connect, daemon=True).start()
     
+    def _on_connected(self):
+        """Show a completed connection"""
+        self.log_message("✅ Broker connected successfully")
+        self.connection_status.set("Connected")
+        self.connect_btn.config(state='normal')
+        self.disconnect_btn.config(state='normal')
+    
     def disconnect_broker(self):
         """Disconnect from broker"""
+        self._cancel_pending()
         self.log_message("❌ Disconnecting from broker...")
         self.connection_status.set("Disconnecting...")
         self.disconnect_btn.config(state='disabled')
+        cancel = self._cancel
         
         def disconnect():
-            time.sleep(1)  # Simulate disconnection
-            self.log_message("✅ Broker disconnected")
-            self.connection_status.set("Disconnected")
-            self.connect_btn.config(state='normal')
-            self.disconnect_btn.config(state='normal')
-            
-            # Stop trading if running
-            if self.trading_status.get() == "Running":
-                self.log_message("🛑 Stopping trading due to disconnection...")
-                self.trading_status.set("Stopped")
+            # Simulate disconnection
+            if not cancel.wait(1.0):
+                self._call_in_gui(self._on_disconnected)
         
         threading.Thread(target=disconnect, daemon=True).start()
     
+    def _on_disconnected(self):
+        """Show a completed disconnection"""
+        self.log_message("✅ Broker disconnected")
+        self.connection_status.set("Disconnected")
+        self.connect_btn.config(state='normal')
+        self.disconnect_btn.config(state='normal')
+        
+        # Stop trading if running (or still starting)
+        if self.trading_status.get() != "Stopped":
+            self.log_message("🛑 Stopping trading due to disconnection...")
+            self.trading_status.set("Stopped")
+            self.start_btn.config(state='normal')
+            self.stop_btn.config(state='normal')
+    
     def start_trading(self):
         """Start trading"""
         if self.connection_status.get() != "Connected":
@@ -180,32 +225,44 @@ class SimplePhoenixGUI:
         self.log_message("🚀 Starting trading system...")
         self.trading_status.set("Starting...")
         self.start_btn.config(state='disabled')
+        cancel = self._cancel
         
         def start():
-            time.sleep(1)  # Simulate startup
-            self.log_message("✅ Trading system started")
-            self.log_message("🔍 Scanning for arbitrage opportunities...")
-            self.trading_status.set("Running")
-            self.start_btn.config(state='normal')
-            self.stop_btn.config(state='normal')
+            # Simulate startup
+            if not cancel.wait(1.0):
+                self._call_in_gui(self._on_trading_started)
         
         threading.Thread(target=start, daemon=True).start()
     
+    def _on_trading_started(self):
+        """Show that trading is running"""
+        self.log_message("✅ Trading system started")
+        self.log_message("🔍 Scanning for arbitrage opportunities...")
+        self.trading_status.set("Running")
+        self.start_btn.config(state='normal')
+        self.stop_btn.config(state='normal')
+    
     def stop_trading(self):
         """Stop trading"""
         self.log_message("🛑 Stopping trading system...")
         self.trading_status.set("Stopping...")
         self.stop_btn.config(state='disabled')
+        cancel = self._cancel
         
         def stop():
-            time.sleep(1)  # Simulate shutdown
-            self.log_message("✅ Trading system stopped")
-            self.trading_status.set("Stopped")
-            self.start_btn.config(state='normal')
-            self.stop_btn.config(state='normal')
+            # Simulate shutdown
+            if not cancel.wait(1.0):
+                self._call_in_gui(self._on_trading_stopped)
         
         threading.Thread(target=stop, daemon=True).start()
     
+    def _on_trading_stopped(self):
+        """Show that trading has stopped"""
+        self.log_message("✅ Trading system stopped")
+        self.trading_status.set("Stopped")
+        self.start_btn.config(state='normal')
+        self.stop_btn.config(state='normal')
+    
     def run(self):
         """Run the GUI"""
         self.root.mainloop()
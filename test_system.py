@@ -8,12 +8,14 @@ Test script for Phoenix trading system components
 
 import sys
 import asyncio
+import importlib.util
 import logging
 from pathlib import Path
 
-# Add project root to Python path
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
+# Add project root to Python path (already there when run as a script)
+project_root = str(Path(__file__).resolve().parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 from phoenix_utils.logger import setup_logger
 from phoenix_utils.config_manager import ConfigManager
@@ -156,13 +158,14 @@ async def test_gui_components():
     print("\n🧪 Testing GUI Components...")
     
     try:
-        # Test if PyQt6 is available
-        from PyQt6.QtWidgets import QApplication
-        from PyQt6.QtCore import QTimer
+        # Probe for PyQt6 without loading the Qt libraries
+        if importlib.util.find_spec('PyQt6') is None:
+            print("⚠️ GUI test skipped (missing dependency): PyQt6")
+            return True  # Not critical for core functionality
         
         print("✅ PyQt6 available")
         
-        # Test Phoenix GUI imports
+        # Test Phoenix GUI imports (the first real Qt import)
         from phoenix_gui.dashboard import PhoenixDashboard, PhoenixStyle
         
         print("✅ Phoenix GUI modules imported")
@@ -213,15 +216,17 @@ async def run_all_tests():
         ("System Integration", test_system_integration)
     ]
     
+    # Tests share no state, so run them concurrently; all run on this thread,
+    # which keeps the Qt import in the GUI test on the main thread
+    outcomes = await asyncio.gather(*(test_func() for _, test_func in tests), return_exceptions=True)
+    
     results = []
     
-    for test_name, test_func in tests:
-        try:
-            result = await test_func()
-            results.append((test_name, result))
-        except Exception as e:
-            print(f"💥 {test_name} crashed: {e}")
-            results.append((test_name, False))
+    for (test_name, _), outcome in zip(tests, outcomes):
+        if isinstance(outcome, Exception):
+            print(f"💥 {test_name} crashed: {outcome}")
+            outcome = False
+        results.append((test_name, outcome))
     
     # Summary
     print("\n" + "=" * 50)
@@ -7,9 +7,10 @@ Simple test for the tkinter GUI
 import sys
 from pathlib import Path
 
-# Add project root to Python path
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
+# Add project root to Python path (already there when run as a script)
+project_root = str(Path(__file__).resolve().parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 from phoenix_gui.tkinter_dashboard import PhoenixTkinterDashboard
 